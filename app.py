@@ -11,11 +11,23 @@ import streamlit as st
 import matplotlib.pyplot as plt
 import qrcode
 from io import BytesIO
+import os
 import shutil
+import time
 from pathlib import Path
 
 
-from utils import gepeto_to_player, gemini_to_player, load_players, run_tournament, get_team_mapping
+from utils import load_players, get_team_mapping, TRUST_GAME, REGISTRY, LLM, META
+from engine import PairStore
+from sandbox import Budget, preflight
+from generation import QUEUE
+from standings import cooperation_view, median_view, standings_frame, total_view
+from archive import StoredRun, delete_run, list_runs
+from runs import DONE, QUEUED, RUNS
+from evolution import ecological, moran, payoff_matrix
+from sweep import grid, iter_sweep, rank_matrix, stability
+from profiling import Profiler, move_rows
+from fingerprint import duplicate_groups, fingerprints
 
 st.set_page_config(page_title="Game of Trust", layout="centered", page_icon="https://humble-engine-7gwpgwp5v5vhggq-8501.app.github.dev/media/de5bb80500f3acd41f01c75c0a0168e8ca73791d83f6546a34207449.png",)
 st.title("🕹️ Game of Trust")
@@ -24,8 +36,9 @@ st.title("🕹️ Game of Trust")
 TURNEU = True
 
 # ---------- Tabs ------------------------------------------------------------
-tab_reguli, tab_submit, tab_tour, tab_qr, tab_admin = st.tabs(
-    ["Prisoner's Dilema", "Propune strategie", "Turneu", "QR Code", "🗑️ Strategii"]
+tab_reguli, tab_submit, tab_tour, tab_sweep, tab_evo, tab_archive, tab_qr, tab_admin = st.tabs(
+    ["Prisoner's Dilema", "Propune strategie", "Turneu", "📈 Sweep", "🧬 Evoluție", "📁 Arhivă", "QR Code",
+     "🗑️ Strategii"]
 )
 
 
@@ -71,19 +84,55 @@ with tab_submit:
             st.error("Te rugăm să completezi toate câmpurile.")
         else:
             try:
-                file_path = gemini_to_player(strat_name, desc, team)
-                # file_path = gepeto_to_player(strat_name, desc, team)
-                st.success(f"✔️ Strategia a fost generată și salvată în `{file_path.name}`.")
+                # generarea rulează în fundal; starea se actualizează mai jos
+                job = QUEUE.submit(team, strat_name, desc, backend="gemini")
+                # job = QUEUE.submit(team, strat_name, desc, backend="openai")
+                st.info(f"⏳ Strategia `{job.name}` a intrat în coada de generare.")
             except Exception as exc:
                 st.exception(exc)
 
+    @st.fragment(run_every="2s")
+    def team_jobs():
+        jobs = QUEUE.jobs(team) if team else []
+        if jobs:
+            st.subheader("Strategiile echipei")
+            st.dataframe(pd.DataFrame([j.as_row() for j in jobs]), use_container_width=True, hide_index=True)
+
+    team_jobs()
+
 
 # ------------------------------------------------------------------ #
+def _stop_tournament():
+    st.session_state["tournament_stopped"] = True
+
+
 with tab_tour:
     if TURNEU:
         st.header("Rulează turneu")
         turns = st.number_input("Runde per joc", 50, 1000, value=200, step=50)
         reps = st.number_input("Repetiții per pereche", 1, 20, value=5, step=1)
+        workers = st.number_input(
+            "Procese worker (1 = serial)", 1, os.cpu_count() or 1, value=os.cpu_count() or 1, step=1
+        )
+        seed = st.number_input("Seed (rezultate reproductibile)", 0, 2**31 - 1, value=42, step=1)
+        incremental = st.checkbox(
+            "Incremental (joacă doar meciurile strategiilor noi sau modificate)", value=True, key=33
+        )
+        fast = st.checkbox(
+            "Motor rapid NumPy pentru strategiile deterministe cu memorie mică", value=True, key=44
+        )
+        dedupe = st.checkbox(
+            "Strategiile cu comportament identic (același tabel de tranziții) joacă meciurile o singură dată",
+            value=True, key=99,
+        )
+        isolated = st.checkbox(
+            "Izolare (fiecare pereche într-un proces separat, cu limită de timp)", value=False, key=55
+        )
+        if isolated:
+            move_ms = st.number_input("Limită per mutare (ms)", 1, 10_000, value=50, step=10)
+            match_s = st.number_input("Limită per pereche (s)", 1, 600, value=10, step=1)
+            budget = Budget(per_move=move_ms / 1000, per_match=float(match_s))
+        archive_run = st.checkbox("Salvează rezultatele în arhivă", value=True, key=66)
         include_classics = st.checkbox(
             "Include strategii clasice (TitForTat, Defector, Cooperator)", value=True, key=11
         )
@@ -91,123 +140,301 @@ with tab_tour:
             "Include strategiile (TitForTwoTats, Grudger, Random)", value=True, key=22
         )
 
-        if st.button("▶️ Rulează turneu"):
-            extra = []
-            if include_classics:
-                extra = [axl.TitForTat(), axl.Defector(), axl.Cooperator()]
-            if include_extras:
-                extra.extend([axl.TitFor2Tats(), axl.Grudger(), axl.Random()])
+        extra = []
+        if include_classics:
+            extra = [axl.TitForTat(), axl.Defector(), axl.Cooperator()]
+        if include_extras:
+            extra.extend([axl.TitFor2Tats(), axl.Grudger(), axl.Random()])
 
+        if st.button("⏱️ Pre-flight (timp per mutare)"):
             try:
-                players = load_players(extra_players=extra)
-                
-                if len(players) < 2:
-                    st.warning("Ai nevoie de cel puțin două strategii pentru a porni turneul.")
-                else:
+                with st.spinner("Aștept un loc liber pe server…"), RUNS.slot():
+                    rows = preflight(
+                        load_players(extra_players=extra),
+                        processes=int(workers),
+                        budget=budget if isolated else None,
+                    )
+                st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+            except Exception as exc:
+                st.exception(exc)
 
-                    # 1. Define your custom payoff values for R, S, T, P
-                    R_custom = 2  # Reward for mutual cooperation
-                    S_custom = -1 # Sucker's payoff (your score if you C, opponent D)
-                    T_custom = 3  # Temptation payoff (your score if you D, opponent C)
-                    P_custom = 0  # Punishment for mutual defection
+        if st.session_state.pop("tournament_stopped", False):
+            st.info("Nu mai urmărești turneul. El continuă pe server, iar rezultatul va fi refolosit.")
 
-                    # 2. Create your custom Game instance
-                    custom_game = axl.Game(r=R_custom, s=S_custom, t=T_custom, p=P_custom)
+        if st.button("▶️ Rulează turneu"):
+            try:
+                profiler = Profiler()
+                with profiler.span("Încărcare strategii"):
+                    players = load_players(extra_players=extra)
+                for file_name, error in REGISTRY.errors().items():
+                    st.warning(f"`{file_name}` a fost sărit: {error}")
 
-                    # 3. SET YOUR CUSTOM GAME AS THE GLOBAL DEFAULT
-                    #    This is the crucial step for run_tournament to use your game.
+                if len(players) < 2:
+                    st.warning("Ai nevoie de cel puțin două strategii pentru a porni turneul.")
+                else:
 
-                    tournament = axl.Tournament(
+                    teams = get_team_mapping()
+                    # o singură rulare pentru toate sesiunile care cer aceleași strategii și
+                    # aceiași parametri (vezi runs.py); jocul e TRUST_GAME: R=2, S=-1, T=3, P=0
+                    run = RUNS.start(
                         players,
                         turns=int(turns),
                         repetitions=int(reps),
+                        game=TRUST_GAME,
                         noise=0,
-                        game=custom_game # <--- This is where your custom game is applied
+                        processes=int(workers),
+                        seed=int(seed),
+                        incremental=incremental,
+                        fast=fast,
+                        dedupe=dedupe,
+                        isolated=isolated,
+                        budget=budget if isolated else None,
+                        # cu profilarea activă (tab-ul de administrare) se cronometrează fiecare mutare
+                        profile=bool(st.session_state.get("profiling")),
                     )
-                    results = tournament.play() # Call the play method on the instance
-                    # st.write(f"Atribute disponibile pe obiectul results: {dir(results)}")
-
-                    # results = run_tournament(players, turns=int(turns), repetitions=int(reps))
-
-                    summary_rows = results.summarise()
-
-                    # Obține valorile pentru noile coloane
-                    cooperating_rating_values = results.cooperating_rating
-                    scores_per_repetition_values = results.scores 
-
-                    # Calculează "Punctajul Total Strategie" prin însumarea listelor din results.scores
-                    # Fiecare sublistă din results.scores corespunde scorurilor unei strategii per repetiție.
-                    # Sumăm aceste subliste pentru a obține scorul total final pentru fiecare strategie.
-                    total_strategy_payoffs = [sum(player_scores) for player_scores in scores_per_repetition_values]
-
-                    # st.write(f"Axelrod library version: {axl.__version__}")
+                    if run.requests > 1:
+                        st.caption(f"Rulare partajată: {run.requests} cereri, calculată o singură dată.")
+
+                    with profiler.span("Joc"):
+                        # butonul doar întrerupe afișarea în această sesiune; rularea continuă
+                        st.button("⏹️ Nu mai urmări turneul", on_click=_stop_tournament)
+                        bar = st.progress(0.0, text="Pornesc turneul…")
+                        live = st.empty()
+                        while not run.finished:
+                            progress = run.progress
+                            if progress is not None:
+                                eta = "-" if progress.eta is None else f"{progress.eta:.0f}s"
+                                bar.progress(
+                                    progress.fraction,
+                                    text=f"{progress.done}/{progress.total} perechi · "
+                                         f"{progress.rate:.1f} perechi/s · ETA {eta}",
+                                )
+                                live.dataframe(
+                                    total_view(standings_frame(progress.results, teams)),
+                                    use_container_width=True,
+                                    hide_index=True,
+                                )
+                            elif run.status == QUEUED:
+                                bar.progress(0.0, text="Serverul rulează deja alte turnee; aștept un loc liber…")
+                            time.sleep(0.3)
+                        bar.empty()
+                        live.empty()
+
+                    if run.status != DONE:
+                        st.error(f"Turneul nu s-a terminat ({run.status}). {run.error or ''}")
+                    else:
+                        results = run.results
+                        for name, reason in getattr(results, "disqualified", {}).items():
+                            st.error(f"**{name}** a fost descalificată: {reason}")
+                        for pair, reason in getattr(results, "errors", {}).items():
+                            st.warning(f"Perechea **{pair}** lipsește (eroare internă): {reason}")
+                        if incremental and not isolated:
+                            st.caption(
+                                f"Meciuri noi: {results.played_pairs} perechi · "
+                                f"refolosite: {results.cached_pairs} perechi"
+                            )
+
+                        if archive_run:
+                            with profiler.span("Arhivare"):
+                                run_id = run.archive(teams)
+                            st.caption(f"Rezultatele sunt salvate în arhivă ca `{run_id}`.")
+
+                        # un singur summarise(); fiecare clasament e o selecție din `frame`
+                        with profiler.span("Clasament (summarise + DataFrame)"):
+                            frame = standings_frame(results, teams)
+
+                        st.subheader("Clasament Punctaj Total")
+                        st.dataframe(total_view(frame), use_container_width=True, hide_index=True)
+
+                        st.subheader("Clasament Scor Median")
+                        st.dataframe(median_view(frame), use_container_width=True, hide_index=True)
+                        st.bar_chart(frame.set_index("Strategie")[["Scor median"]].round(2))
+
+                        st.subheader("Rating Cooperare")
+                        st.dataframe(cooperation_view(frame), use_container_width=True, hide_index=True)
+
+                        if run.timings is not None:
+                            st.session_state["last_profile"] = {
+                                "spans": profiler.rows(),
+                                "moves": move_rows([str(p) for p in players], run.timings),
+                            }
+                            st.caption("Profilul rulării e în tab-ul de administrare.")
 
-                    meta = get_team_mapping()
+            except Exception as exc:
+                st.exception(exc)
+    else:
+        st.markdown("Un pic de răbdare până când toate echipele au o strategie...")
 
-                    df_primul = pd.DataFrame(
-                        data = {
-                             "Echipa": [meta.get(row.Name.strip().lower().replace(" ", "")) for row in results.summarise()],
-                             "Strategie": [row.Name for row in results.summarise()],
-                             "Puncte": [round(score, 2) for score in total_strategy_payoffs], # Scorul total final calculat
-                        }
-                    )
-                    df_primul = df_primul.sort_values(by="Puncte", ascending=False).reset_index(drop=True)
-
-
-                    df = pd.DataFrame(
-                         data = {
-                             "Rank": [row.Rank+1 for row in results.summarise()],
-                             "Echipa": [meta.get(row.Name.strip().lower().replace(" ", "")) for row in results.summarise()],
-                             "Strategie": [row.Name for row in results.summarise()],
-                             "Scor median": [round(row.Median_score,2) for row in results.summarise()],
-                             "Puncte": [round(score, 2) for score in total_strategy_payoffs], # Scorul total final calculat
-                             #"Wins": [row.Wins for row in results.summarise()],
-                             "CC": [f"{row.CC_rate:.0%}" for row in results.summarise()],
-                             "CT": [f"{row.CD_rate:.0%}" for row in results.summarise()],
-                             "TC": [f"{row.DC_rate:.0%}" for row in results.summarise()],
-                             "TT": [f"{row.DD_rate:.0%}" for row in results.summarise()],
-                         }
-                    )
+# ------------------------------------------------------------------ #
+with tab_sweep:
+    if TURNEU:
+        st.header("Cum se schimbă clasamentul cu parametrii")
+        st.markdown("Valorile se separă prin virgulă; fiecare combinație e un turneu separat.")
+        noises_text = st.text_input("Zgomot", "0, 0.01, 0.05")
+        turns_text = st.text_input("Runde per joc", "50, 200")
+        reps_text = st.text_input("Repetiții per pereche", "5")
+        payoffs_text = st.text_area("Plăți R, S, T, P (câte un joc pe linie)", "2, -1, 3, 0\n3, 0, 5, 1")
+        sweep_seed = st.number_input("Seed", 0, 2**31 - 1, value=42, step=1, key="sweep_seed")
+        sweep_classics = st.checkbox(
+            "Include strategii clasice (TitForTat, Defector, Cooperator)", value=True, key=88
+        )
 
-                    df_mine = pd.DataFrame(
-                    data = {
-                        "Scor median": [round(row.Median_score,2) for row in results.summarise()],
-                        "Strategie": [row for row in results.ranked_names],
-                    }    
-                    )
+        if st.button("📈 Rulează sweep"):
+            try:
+                def numbers(text, kind=float):
+                    return [kind(x) for x in text.replace(";", ",").split(",") if x.strip()]
+
+                cells = grid(
+                    noises=numbers(noises_text),
+                    turns=numbers(turns_text, int),
+                    repetitions=numbers(reps_text, int),
+                    payoffs=[tuple(numbers(line)) for line in payoffs_text.splitlines() if line.strip()],
+                )
+                players = load_players(
+                    extra_players=[axl.TitForTat(), axl.Defector(), axl.Cooperator()] if sweep_classics else []
+                )
+                if len(players) < 2:
+                    st.warning("Ai nevoie de cel puțin două strategii.")
+                else:
+                    bar = st.progress(0.0, text=f"0/{len(cells)} celule")
+                    parts = []
+                    # ocupă un loc din RUNS, ca și turneele: CPU-ul rămâne limitat oricâte sesiuni ar fi
+                    with RUNS.slot():
+                        for part in iter_sweep(
+                            players, cells, seed=int(sweep_seed), processes=os.cpu_count() or 1,
+                            store=PairStore(), teams=get_team_mapping(),
+                        ):
+                            parts.append(part)
+                            bar.progress(len(parts) / len(cells), text=f"{len(parts)}/{len(cells)} celule")
+                    table = pd.concat(parts, ignore_index=True)
+
+                    st.subheader("Stabilitatea rangului")
+                    st.dataframe(stability(table), use_container_width=True, hide_index=True)
+
+                    ranks = rank_matrix(table)
+                    fig, ax = plt.subplots(figsize=(1 + 0.6 * ranks.shape[1], 1 + 0.3 * ranks.shape[0]))
+                    image = ax.imshow(ranks.values, cmap="RdYlGn_r", aspect="auto")
+                    ax.set_xticks(range(ranks.shape[1]), ranks.columns, rotation=90, fontsize=7)
+                    ax.set_yticks(range(ranks.shape[0]), ranks.index, fontsize=7)
+                    fig.colorbar(image, ax=ax, label="Rank")
+                    st.pyplot(fig)
+
+                    st.subheader("Toate rezultatele")
+                    st.dataframe(table.round(3), use_container_width=True, hide_index=True)
+                    st.download_button("Descarcă CSV", table.to_csv(index=False), "sweep.csv", "text/csv")
+            except Exception as exc:
+                st.exception(exc)
+    else:
+        st.markdown("Un pic de răbdare până când toate echipele au o strategie...")
 
+# ------------------------------------------------------------------ #
+with tab_evo:
+    if TURNEU:
+        st.header("Populație în evoluție")
+        st.markdown(
+            "Fiecare strategie pornește cu aceeași pondere în populație. Strategiile care "
+            "câștigă mai mult contra populației curente se înmulțesc, celelalte dispar."
+        )
+        mode = st.radio("Dinamică", ["Ecologică (replicator)", "Moran (populație finită)"], horizontal=True)
+        generations = st.number_input("Generații", 10, 20_000, value=1000, step=100)
+        if mode.startswith("Moran"):
+            population = st.number_input("Mărimea populației", 2, 1000, value=100, step=10)
+            runs = st.number_input("Simulări (media lor e afișată)", 1, 200, value=20, step=5)
+        evo_seed = st.number_input("Seed", 0, 2**31 - 1, value=42, step=1, key="evo_seed")
+        evo_classics = st.checkbox(
+            "Include strategii clasice (TitForTat, Defector, Cooperator)", value=True, key=77
+        )
 
-                    # --- AICI ESTE DATAFRAME-UL NOU CERUT ---
-                    df_new_metrics = pd.DataFrame(
-                        data = {
-                            "Rank": results.ranking,
-                            "Strategie": results.ranked_names, # Numele strategiilor, deja ordonate
-                            "Cooperare": [round(rating, 2) for rating in results.cooperating_rating],
-                            "Scoruri": scores_per_repetition_values, # Lista de scoruri per repetiție
-                            "Puncte": [round(score, 2) for score in total_strategy_payoffs], # Scorul total final calculat
-                        }
+        if st.button("🧬 Pornește evoluția"):
+            try:
+                players = load_players(
+                    extra_players=[axl.TitForTat(), axl.Defector(), axl.Cooperator()] if evo_classics else []
+                )
+                if len(players) < 2:
+                    st.warning("Ai nevoie de cel puțin două strategii.")
+                else:
+                    # meciurile se joacă o singură dată (și se refolosesc din PairStore);
+                    # generațiile lucrează doar pe matricea de plăți
+                    names = [str(p) for p in players]
+                    # matricea și generațiile ocupă un loc din RUNS: Moran cu 1000 de indivizi
+                    # × 20.000 de generații consumă CPU cât un turneu
+                    with st.spinner("Calculez matricea de plăți și generațiile…"), RUNS.slot():
+                        matrix = payoff_matrix(
+                            players, game=TRUST_GAME, seed=int(evo_seed),
+                            processes=os.cpu_count() or 1, store=PairStore(),
+                        )
+                        if mode.startswith("Moran"):
+                            shares = moran(
+                                matrix, names, population=int(population), generations=int(generations),
+                                runs=int(runs), seed=int(evo_seed),
+                            )
+                        else:
+                            shares = ecological(matrix, names, generations=int(generations))
+
+                    st.area_chart(shares)
+                    final = shares.iloc[-1].sort_values(ascending=False)
+                    teams = get_team_mapping()
+                    st.dataframe(
+                        pd.DataFrame(
+                            {
+                                "Echipa": [teams.get(n.strip().lower().replace(" ", "")) for n in final.index],
+                                "Strategie": final.index,
+                                "Pondere finală": final.map("{:.1%}".format).values,
+                            }
+                        ),
+                        use_container_width=True,
+                        hide_index=True,
                     )
-                    df_new_metrics = df_new_metrics.sort_values(by="Puncte", ascending=False).reset_index(drop=True)
-                    # --- SFÂRȘIT DATAFRAME NOU ---
-
-                    st.subheader("Clasament Punctaj Total")
-                    st.dataframe(df_primul, use_container_width=True, hide_index=True)
-
-                    st.subheader("Clasament Scor Median")
-                    st.dataframe(df, use_container_width=True, hide_index=True)
-                    st.bar_chart(df_mine.set_index("Strategie"))
-
-                    st.subheader("Rating Cooperare")
-                    st.dataframe(df_new_metrics, use_container_width=True, hide_index=True)
-
-
-
-
+                    with st.expander("Matricea de plăți (scor mediu pe rundă, rând contra coloană)"):
+                        st.dataframe(pd.DataFrame(matrix, index=names, columns=names).round(2))
             except Exception as exc:
                 st.exception(exc)
     else:
         st.markdown("Un pic de răbdare până când toate echipele au o strategie...")
 
+# ------------------------------------------------------------------ #
+with tab_archive:
+    st.header("Turnee anterioare")
+    runs = list_runs()
+    if not runs:
+        st.info("Nu există încă turnee salvate.")
+    else:
+        st.dataframe(pd.DataFrame(runs), use_container_width=True, hide_index=True)
+        run_id = st.selectbox("Rulare", [r["Rulare"] for r in runs])
+        run = StoredRun(run_id)
+        st.caption(
+            f"{len(run.players)} jucători · {run.meta['turns']} runde · "
+            f"{run.meta['repetitions']} repetiții · {run.nbytes / 1024:.0f} KiB pe disc"
+        )
+        frame = run.standings()
+        st.subheader("Clasament Punctaj Total")
+        st.dataframe(total_view(frame), use_container_width=True, hide_index=True)
+        st.subheader("Clasament Scor Median")
+        st.dataframe(median_view(frame), use_container_width=True, hide_index=True)
+
+        st.subheader("Meciul unei perechi")
+        col_a, col_b = st.columns(2)
+        a = col_a.selectbox("Jucătorul A", range(len(run.players)), format_func=run.players.__getitem__)
+        b = col_b.selectbox("Jucătorul B", range(len(run.players)), index=min(1, len(run.players) - 1),
+                            format_func=run.players.__getitem__)
+        if a != b:
+            scores = run.pair_scores(a, b)
+            first = run.interactions(a, b)[0]
+            st.dataframe(
+                pd.DataFrame({"Repetiție": range(1, len(scores) + 1), "Scor A": scores[:, 0], "Scor B": scores[:, 1]}),
+                hide_index=True,
+            )
+            moves = {"0": ("C", "C"), "1": ("C", "T"), "2": ("T", "C"), "3": ("T", "T")}
+            st.code(
+                "A: " + "".join(moves[c][0] for c in first[:100]) + "\n"
+                "B: " + "".join(moves[c][1] for c in first[:100]),
+                language="text",
+            )
+
+        if st.button("Șterge această rulare", type="secondary"):
+            delete_run(run_id)
+            st.success("✔️ Rulare ștearsă. Reîncarcă pagina.")
+
 # ------------------------------------------------------------------ #
 with tab_qr:
     st.header("Scanează QR-ul")
@@ -241,15 +468,79 @@ with tab_admin:
         st.info("Nu există fișiere .py în `strategies/`.")
     else:
         st.markdown("**Fișiere existente:**")
-        st.code("\n".join(files), language="text")
+        st.dataframe(
+            pd.DataFrame([record.as_row() for record in REGISTRY.refresh()]),
+            use_container_width=True,
+            hide_index=True,
+        )
+        st.markdown("**Metadate:**")
+        st.dataframe(pd.DataFrame(META.rows()), use_container_width=True, hide_index=True)
+
+        st.markdown("**Amprente comportamentale** (200 de runde, jocul arenei):")
+        try:
+            roster = load_players()
+            prints = fingerprints(roster, turns=200, game=TRUST_GAME)
+            twins = {name: names for names in duplicate_groups(roster, 200, TRUST_GAME).values() for name in names}
+            teams = get_team_mapping()
+            st.dataframe(
+                pd.DataFrame(
+                    {
+                        "Strategie": [str(p) for p in roster],
+                        "Echipa": [teams.get(str(p).strip().lower().replace(" ", "")) for p in roster],
+                        "Amprentă": [fp or "stocastică" for fp in prints],
+                        "Identică (același tabel) cu": [
+                            ", ".join(n for n in twins.get(str(p), []) if n != str(p)) or None for p in roster
+                        ],
+                    }
+                ),
+                use_container_width=True,
+                hide_index=True,
+            )
+        except Exception as exc:
+            st.exception(exc)
 
         if st.button("Șterge TOT conținutul folder-ului strategies", type="secondary"):
             try:
-                # Șterge toate fișierele .py și meta.json, dar păstrează folderul
+                # Șterge toate fișierele .py și metadatele, dar păstrează folderul
                 for p in strategy_dir.glob("*.py"):
                     p.unlink(missing_ok=True)
-                (strategy_dir / "meta.json").unlink(missing_ok=True)
+                META.clear()
                 st.success("✔️ Folder golit. Reîncarcă pagina pentru a vedea starea actualizată.")
             except Exception as exc:
                 st.exception(exc)
 
+
+    st.subheader("Rulări partajate")
+    shared = RUNS.runs()
+    if shared:
+        st.dataframe(pd.DataFrame([r.as_row() for r in shared]), use_container_width=True, hide_index=True)
+        active = [r for r in shared if not r.finished]
+        if active:
+            victim = st.selectbox("Rulare în curs", [r.key[:12] for r in active])
+            if st.button("Oprește rularea pentru toți", type="secondary"):
+                RUNS.cancel(next(r.key for r in active if r.key[:12] == victim))
+                st.success("✔️ Rularea se va opri după perechea curentă.")
+    else:
+        st.caption("Nicio rulare de la pornirea serverului.")
+
+    st.subheader("Profilare")
+    st.checkbox(
+        "Cronometrează etapele și fiecare mutare la următorul turneu (încetinește jocul)",
+        key="profiling",
+    )
+    profile = st.session_state.get("last_profile")
+    if profile:
+        st.markdown("**Etape:**")
+        st.dataframe(pd.DataFrame(profile["spans"]), use_container_width=True, hide_index=True)
+        st.markdown(
+            "**Timp per mutare** (toate perechile, jucate cu axl.Match: profilarea ocolește "
+            "cache-ul, motorul NumPy și dedupe):"
+        )
+        st.dataframe(pd.DataFrame(profile["moves"]), use_container_width=True, hide_index=True)
+
+    if LLM.cache is not None:
+        st.subheader("Cache cod generat")
+        st.dataframe(pd.DataFrame([LLM.cache.stats()]), use_container_width=True, hide_index=True)
+        if st.button("Golește cache-ul de cod", type="secondary"):
+            LLM.cache.clear()
+            st.success("✔️ Cache golit.")
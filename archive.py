@@ -0,0 +1,179 @@
+"""
+Arhiva turneelor jucate, într-un format binar compact:
+
+    strategies/.runs/<run_id>/
+        meta.json       parametrii turneului, jucătorii, echipele
+        standings.json  clasamentul final (deschis instantaneu în app)
+        pairs.npy       int32  [perechi, 2]                 indicii jucătorilor
+        actions.npy     uint8  [perechi, repetiții, 2, ⌈runde/8⌉]  un bit per mutare (1 = D)
+        lengths.npy     int32  [perechi, repetiții]         numărul de runde jucate
+        scores.npy      float64 [perechi, repetiții, 2]     scorul fiecărui jucător
+
+Fișierele .npy se deschid cu memory-mapping (`np.load(..., mmap_mode="r")`),
+deci o rulare veche se citește fără a fi deserializată integral: doar
+perechile consultate ajung efectiv în memorie.
+
+• save_run  – salvează un engine.PairwiseResults
+• list_runs – rulările salvate, cele mai noi primele
+• StoredRun – o rulare deschisă: clasament, interacțiunile unei perechi,
+              reconstrucția completă a rezultatelor
+"""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import shutil
+import time
+import uuid
+from typing import Dict, List
+
+import axelrod as axl
+import numpy as np
+import pandas as pd
+
+from engine import Interactions, PairwiseResults, flip
+from standings import standings_frame
+from utils import STRATEGY_DIR
+
+RUNS_DIR = STRATEGY_DIR / ".runs"
+
+
+# --------------------------------------------------------------------------- #
+def _pack(reps: Interactions, turns: int) -> tuple:
+    """Șirurile codificate ale unei perechi → biții împachetați (A, B) și lungimile."""
+    bits = np.zeros((len(reps), 2, turns), dtype=np.uint8)
+    lengths = np.zeros(len(reps), dtype=np.int32)
+    for rep, encoded in enumerate(reps):
+        codes = np.frombuffer(encoded.encode("ascii"), dtype=np.uint8) - ord("0")
+        bits[rep, 0, : len(codes)] = codes >> 1
+        bits[rep, 1, : len(codes)] = codes & 1
+        lengths[rep] = len(codes)
+    return np.packbits(bits, axis=-1), lengths
+
+
+def _unpack(packed: np.ndarray, lengths: np.ndarray) -> Interactions:
+    """Inversul lui `_pack`, pentru o singură pereche."""
+    out = []
+    for rep in range(packed.shape[0]):
+        bits = np.unpackbits(packed[rep], axis=-1, count=int(lengths[rep]))
+        codes = (2 * bits[0] + bits[1] + ord("0")).astype(np.uint8)
+        out.append(codes.tobytes().decode("ascii"))
+    return out
+
+
+def save_run(
+    results: PairwiseResults,
+    turns: int,
+    game: axl.Game,
+    params: Dict[str, object] | None = None,
+    teams: Dict[str, str] | None = None,
+    directory: pathlib.Path = RUNS_DIR,
+) -> str:
+    """Salvează rularea și întoarce id-ul ei (ordonabil cronologic)."""
+    run_id = time.strftime("%Y%m%d-%H%M%S") + "-" + uuid.uuid4().hex[:6]
+    path = directory / run_id
+    tmp = directory / f".{run_id}.tmp"
+    tmp.mkdir(parents=True)
+
+    pairs = sorted(p for p in results.interactions if p[0] != p[1])
+    reps = results.repetitions
+    R, P, S, T = (float(x) for x in game.RPST())  # np.int64 în axelrod 4.14; meta.json vrea numere Python
+    actions = np.zeros((len(pairs), reps, 2, (turns + 7) // 8), dtype=np.uint8)
+    lengths = np.zeros((len(pairs), reps), dtype=np.int32)
+    scores = np.zeros((len(pairs), reps, 2), dtype=np.float64)
+    for k, pair in enumerate(pairs):
+        encoded = results.interactions[pair]
+        actions[k], lengths[k] = _pack(encoded, turns)
+        for rep, e in enumerate(encoded):
+            cc, cd, dc, dd = (e.count(s) for s in "0123")
+            scores[k, rep] = (R * cc + S * cd + T * dc + P * dd, R * cc + T * cd + S * dc + P * dd)
+
+    np.save(tmp / "pairs.npy", np.array(pairs, dtype=np.int32).reshape(-1, 2))
+    np.save(tmp / "actions.npy", actions)
+    np.save(tmp / "lengths.npy", lengths)
+    np.save(tmp / "scores.npy", scores)
+    meta = {
+        "run_id": run_id,
+        "created": time.time(),
+        "players": results.players,
+        "turns": turns,
+        "repetitions": reps,
+        "game": [R, P, S, T],
+        "params": params or {},
+        "teams": teams or {},
+    }
+    (tmp / "meta.json").write_text(json.dumps(meta, indent=2))
+    standings_frame(results, teams).to_json(tmp / "standings.json", orient="records")
+    tmp.rename(path)  # rularea apare în arhivă doar când e completă
+    return run_id
+
+
+def list_runs(directory: pathlib.Path = RUNS_DIR) -> List[Dict[str, object]]:
+    if not directory.exists():
+        return []
+    runs = []
+    for meta_file in directory.glob("*/meta.json"):
+        meta = json.loads(meta_file.read_text())
+        runs.append(
+            {
+                "Rulare": meta["run_id"],
+                "Jucători": len(meta["players"]),
+                "Runde": meta["turns"],
+                "Repetiții": meta["repetitions"],
+                "Data": time.strftime("%Y-%m-%d %H:%M", time.localtime(meta["created"])),
+            }
+        )
+    return sorted(runs, key=lambda r: r["Rulare"], reverse=True)
+
+
+def delete_run(run_id: str, directory: pathlib.Path = RUNS_DIR) -> None:
+    shutil.rmtree(directory / run_id, ignore_errors=True)
+
+
+# --------------------------------------------------------------------------- #
+class StoredRun:
+    """O rulare din arhivă; tablourile mari sunt memory-mapped, nu citite integral."""
+
+    def __init__(self, run_id: str, directory: pathlib.Path = RUNS_DIR):
+        self.path = directory / run_id
+        self.meta = json.loads((self.path / "meta.json").read_text())
+        self.players: List[str] = self.meta["players"]
+        self.pairs = np.load(self.path / "pairs.npy", mmap_mode="r")
+        self.actions = np.load(self.path / "actions.npy", mmap_mode="r")
+        self.lengths = np.load(self.path / "lengths.npy", mmap_mode="r")
+        self.scores = np.load(self.path / "scores.npy", mmap_mode="r")
+        self._index = {(int(i), int(j)): k for k, (i, j) in enumerate(self.pairs)}
+
+    def standings(self) -> pd.DataFrame:
+        return pd.read_json(self.path / "standings.json", orient="records")
+
+    def interactions(self, i: int, j: int) -> Interactions:
+        """Meciurile perechii (i, j), codificate din perspectiva lui i.
+
+        KeyError dacă perechea nu e în arhivă (de ex. i == j sau un indice necunoscut).
+        """
+        if (i, j) in self._index:
+            k = self._index[(i, j)]
+            return _unpack(self.actions[k], self.lengths[k])
+        k = self._index[(j, i)]
+        return [flip(e) for e in _unpack(self.actions[k], self.lengths[k])]
+
+    def pair_scores(self, i: int, j: int) -> np.ndarray:
+        """Scorurile [repetiții, 2] ale perechii (i, j)."""
+        if (i, j) in self._index:
+            return np.asarray(self.scores[self._index[(i, j)]])
+        return np.asarray(self.scores[self._index[(j, i)]])[:, ::-1]
+
+    def to_results(self) -> PairwiseResults:
+        """Reconstruiește rezultatele complete (decodifică toate perechile)."""
+        R, P, S, T = self.meta["game"]
+        game = axl.Game(r=R, s=S, t=T, p=P)
+        interactions = {pair: _unpack(self.actions[k], self.lengths[k]) for pair, k in self._index.items()}
+        return PairwiseResults(self.players, interactions, self.meta["repetitions"], game)
+
+    @property
+    def nbytes(self) -> int:
+        """Dimensiunea pe disc a tablourilor binare."""
+        names = ("pairs.npy", "actions.npy", "lengths.npy", "scores.npy")
+        return sum((self.path / name).stat().st_size for name in names)
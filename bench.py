@@ -0,0 +1,451 @@
+"""
+Benchmark pentru arena Prisoner's Dilemma.
+
+• scaling – cât scade timpul unui turneu când creștem numărul de procese worker
+            (cu motorul tab-ului Turneu; verifică și că rezultatele sunt identice
+            cu rularea serială)
+• fast-engine – compară motorul NumPy (vectorized.py) cu axl.Match pe strategiile
+            clasice și pe câteva cu memoria declarată greșit: interacțiunile
+            și scorurile trebuie să fie identice
+• generation – debitul cozii de generare (trimiteri/minut) pe un backend fals
+• metastore – N procese scriu simultan în MetaStore; nicio scriere nu se pierde
+• summary   – vechiul mod (un summarise() per coloană) vs. standings_frame, la 50 și 200 de jucători
+• memory    – memoria interacțiunilor: liste axelrod în memorie vs. arhiva pe biți (archive.py)
+• evolution – matricea de plăți, apoi mii de generații ecologice / Moran (evolution.py)
+• pipeline  – încărcare → joc → summarise() → DataFrame pe 10/50/200 de strategii sintetice
+            (fișiere .py, adâncimi de memorie 0–3 și ∞): timp și memorie maximă per etapă
+
+Rulează cu:   python bench.py scaling --players 40 --turns 1000 --repetitions 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import pathlib
+import random
+import tempfile
+import time
+import tracemalloc
+from typing import List
+
+import axelrod as axl
+
+from archive import StoredRun, save_run
+from engine import PairwiseResults, play_pair, stream_tournament
+from evolution import ecological, moran, payoff_matrix
+from generation import DONE, FakeClient, GenerationQueue
+from metastore import MetaStore
+from profiling import Profiler
+from registry import StrategyRegistry
+from standings import cooperation_view, median_view, standings_frame, total_view
+from utils import TRUST_GAME, run_tournament
+from vectorized import FastEngine
+
+C, D = axl.Action.C, axl.Action.D
+
+CLASSICS = [
+    axl.TitForTat, axl.Grudger, axl.TitFor2Tats, axl.TwoTitsForTat, axl.SuspiciousTitForTat,
+    axl.WinStayLoseShift, axl.Cooperator, axl.Defector, axl.Alternator, axl.CyclerCCD,
+]
+
+
+# --------------------------------------------------------------------------- #
+class _Misdeclared(axl.Player):
+    """Declară memory_depth 1, dar are stare ascunsă care apare abia târziu în meci."""
+
+    classifier = {
+        "memory_depth": 1,
+        "stochastic": False,
+        "long_run_time": False,
+        "inspects_source": False,
+        "manipulates_source": False,
+        "manipulates_state": False,
+    }
+
+
+class LateDefector(_Misdeclared):
+    name = "Late Defector"
+
+    def strategy(self, opponent):
+        if len(self.history) >= 50:
+            return D
+        return D if opponent.history[-1:] == [D] else C
+
+
+class ThresholdGrudger(_Misdeclared):
+    name = "Threshold Grudger"
+
+    def strategy(self, opponent):
+        if opponent.defections > 10:
+            return D
+        return D if opponent.history[-1:] == [D] else C
+
+
+# trebuie să rămână pe axl.Match (la turnee mai lungi de 50 de runde)
+MISDECLARED = [LateDefector, ThresholdGrudger]
+
+
+# --------------------------------------------------------------------------- #
+def synthetic_players(n: int) -> List[axl.Player]:
+    """Primii `n` jucători din biblioteca axelrod cu timp de rulare scurt."""
+    pool = list(axl.short_run_time_strategies)
+    return [pool[i % len(pool)]() for i in range(n)]
+
+
+SYNTHETIC_STRATEGY = """import axelrod as axl
+
+C, D = axl.Action.C, axl.Action.D
+
+
+class {name}(axl.Player):
+    name = "{name}"
+    classifier = {{
+        "memory_depth": {depth},
+        "stochastic": False,
+        "long_run_time": False,
+        "inspects_source": False,
+        "manipulates_source": False,
+        "manipulates_state": False,
+    }}
+
+    def strategy(self, opponent):
+        {body}
+"""
+
+# adâncime de memorie → corpul lui strategy(), ca în strategiile generate
+SYNTHETIC_BODIES = [
+    ("0", "return C if {k} % 2 else D"),
+    ("1", "return D if opponent.history[-1:] == [D] else C"),
+    ("2", "return D if D in opponent.history[-2:] else C"),
+    ("3", "return D if opponent.history[-3:].count(D) >= 2 else C"),
+    ('float("inf")', "return D if opponent.defections > len(self.history) // {m} else C"),
+]
+
+
+def synthetic_strategy_files(n: int, directory: pathlib.Path) -> None:
+    """Scrie `n` fișiere de strategie în `directory`, cu adâncimi de memorie variate."""
+    for k in range(n):
+        depth, body = SYNTHETIC_BODIES[k % len(SYNTHETIC_BODIES)]
+        code = SYNTHETIC_STRATEGY.format(name=f"Sintetic{k}", depth=depth, body=body.format(k=k, m=2 + k % 5))
+        (directory / f"Sintetic{k}.py").write_text(code, encoding="utf-8")
+
+
+def _timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    out = fn(*args, **kwargs)
+    return out, time.perf_counter() - start
+
+
+# --------------------------------------------------------------------------- #
+def bench_scaling(players: int, turns: int, repetitions: int, seed: int, max_workers: int, fast: bool) -> None:
+    """Timpul de rulare al `run_tournament` (motorul tab-ului Turneu) pentru 1, 2, 4, … procese."""
+    counts = [1]
+    while counts[-1] * 2 <= max_workers:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_workers:
+        counts.append(max_workers)
+
+    print(f"{players} jucători, {turns} runde, {repetitions} repetiții, seed={seed}, "
+          f"motor rapid: {'da' if fast else 'nu'}")
+    print(f"{'procese':>8} {'secunde':>10} {'speedup':>8} {'identic':>8}")
+
+    baseline = None
+    serial_time = None
+    for processes in counts:
+        results, elapsed = _timed(
+            run_tournament,
+            synthetic_players(players),
+            turns=turns,
+            repetitions=repetitions,
+            game=TRUST_GAME,
+            processes=processes,
+            seed=seed,
+            fast=fast,
+        )
+        signature = (results.ranked_names, results.scores)
+        if baseline is None:
+            baseline, serial_time = signature, elapsed
+        print(
+            f"{processes:>8} {elapsed:>10.2f} {serial_time / elapsed:>8.2f}x "
+            f"{'da' if signature == baseline else 'NU':>8}"
+        )
+
+
+# --------------------------------------------------------------------------- #
+def bench_fast_engine(turns: int, repetitions: int) -> None:
+    """Verifică faptul că motorul NumPy dă exact aceleași rezultate ca axl.Match,
+    inclusiv pentru strategii cu memoria declarată greșit (MISDECLARED)."""
+    players = [cls() for cls in CLASSICS + MISDECLARED]
+    pairs = [(i, j) for i in range(len(players)) for j in range(i + 1, len(players))]
+
+    engine, build_time = _timed(FastEngine, players, turns, TRUST_GAME)
+    for i, player in enumerate(players):
+        print(f"{str(player):<28} {'NumPy' if engine.supports(i) else 'axl.Match'}")
+
+    fast_pairs = [(i, j) for i, j in pairs if engine.supports(i) and engine.supports(j)]
+    fast, fast_time = _timed(engine.play, fast_pairs)
+    fast = dict(zip(fast_pairs, fast))
+
+    slow, slow_time = {}, 0.0
+    for i, j in pairs:
+        slow[(i, j)], elapsed = _timed(play_pair, players[i], players[j], turns, repetitions, TRUST_GAME)
+        if (i, j) in fast:
+            slow_time += elapsed
+
+    mismatches = [pair for pair, encoded in fast.items() if slow[pair] != [encoded] * repetitions]
+    merged = {pair: [fast[pair]] * repetitions if pair in fast else slow[pair] for pair in pairs}
+    names = [str(p) for p in players]
+    same_scores = (
+        PairwiseResults(names, merged, repetitions, TRUST_GAME).scores
+        == PairwiseResults(names, slow, repetitions, TRUST_GAME).scores
+    )
+
+    print(f"\n{len(fast_pairs)} perechi NumPy: {build_time + fast_time:.3f}s "
+          f"(tabele {build_time:.3f}s) vs axl.Match {slow_time:.3f}s")
+    print(f"interacțiuni identice: {'da' if not mismatches else 'NU ' + str(mismatches)}")
+    print(f"scoruri identice: {'da' if same_scores else 'NU'}")
+    if mismatches or not same_scores:
+        raise SystemExit(1)
+
+
+# --------------------------------------------------------------------------- #
+def bench_generation(submissions: int, concurrency: int, latency: float, failure_rate: float) -> None:
+    """Câte strategii pe minut trec prin coadă când API-ul are latență și erori."""
+    with tempfile.TemporaryDirectory() as tmp:
+        def save(name, code, team, backend=None):
+            path = pathlib.Path(tmp) / f"{name}.py"
+            path.write_text(code, encoding="utf-8")
+            return path
+
+        client = FakeClient(latency=latency, failure_rate=failure_rate, seed=0)
+        queue = GenerationQueue(client, max_concurrency=concurrency, base_delay=latency / 4, save=save)
+        start = time.perf_counter()
+        for k in range(submissions):
+            queue.submit(f"echipa{k}", f"Strategie{k}", "Cooperez, apoi copiez adversarul.", backend="fake")
+        queue.wait()
+        elapsed = time.perf_counter() - start
+
+    done = sum(job.status == DONE for job in queue.jobs())
+    print(f"{submissions} trimiteri, concurență {concurrency}, latență {latency}s, erori {failure_rate:.0%}")
+    print(f"reușite: {done}/{submissions}, apeluri API: {client.calls}, timp: {elapsed:.2f}s")
+    print(f"debit: {done / elapsed * 60:.1f} trimiteri/minut")
+
+
+# --------------------------------------------------------------------------- #
+def _metastore_writer(path: str, writer: int, records: int) -> None:
+    store = MetaStore(pathlib.Path(path))
+    for k in range(records):
+        store.upsert(f"Strategie_{writer}_{k}", team=f"echipa{writer}", backend="fake")
+        # toți scriitorii modifică și aceeași strategie, ca la salvări simultane
+        store.upsert("Comuna", team=f"echipa{writer}", status=f"{writer}:{k}")
+
+
+def bench_metastore(writers: int, records: int) -> None:
+    """Test de stres: `writers` procese paralele × `records` scrieri fiecare."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(pathlib.Path(tmp) / "meta.db")
+        MetaStore(pathlib.Path(path))  # creează schema înainte de pornirea scriitorilor
+        ctx = multiprocessing.get_context("fork")
+        procs = [ctx.Process(target=_metastore_writer, args=(path, w, records)) for w in range(writers)]
+        start = time.perf_counter()
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join()
+        elapsed = time.perf_counter() - start
+
+        mapping = MetaStore(pathlib.Path(path)).team_mapping()
+        expected = {f"strategie_{w}_{k}": f"echipa{w}" for w in range(writers) for k in range(records)}
+        missing = [key for key, team in expected.items() if mapping.get(key) != team]
+        failed = [proc.exitcode for proc in procs if proc.exitcode != 0]
+
+    total = writers * records * 2
+    print(f"{writers} scriitori × {records} strategii: {total} scrieri în {elapsed:.2f}s "
+          f"({total / elapsed:.0f} scrieri/s)")
+    print(f"procese eșuate: {len(failed)}, scrieri pierdute: {len(missing)}")
+    if missing or failed:
+        raise SystemExit(1)
+
+
+# --------------------------------------------------------------------------- #
+def _old_tables(results) -> None:
+    """Construcția tabelelor cum era în app.py: câte un summarise() per coloană."""
+    [sum(scores) for scores in results.scores]
+    columns = ("Name", "Name", "Rank", "Name", "Median_score", "CC_rate", "CD_rate", "DC_rate", "DD_rate",
+               "Median_score")
+    for column in columns:
+        [getattr(row, column) for row in results.summarise()]
+
+
+def _new_tables(results) -> None:
+    frame = standings_frame(results)
+    total_view(frame), median_view(frame), cooperation_view(frame)
+
+
+def bench_summary(sizes: List[int], turns: int, repetitions: int) -> None:
+    """Timpul de construire a clasamentelor pentru turnee de diverse mărimi."""
+    print(f"{'jucători':>9} {'vechi (s)':>10} {'nou (s)':>10} {'speedup':>8}")
+    for n in sizes:
+        # axl.Result recalculează summarise() la fiecare apel: exact costul vechiului mod
+        results = axl.Tournament(
+            synthetic_players(n), turns=turns, repetitions=repetitions, game=TRUST_GAME, seed=0
+        ).play(progress_bar=False)
+        _, old = _timed(_old_tables, results)
+        _, new = _timed(_new_tables, results)
+        print(f"{n:>9} {old:>10.3f} {new:>10.3f} {old / new:>7.1f}x")
+
+
+# --------------------------------------------------------------------------- #
+def bench_memory(players: int, turns: int, repetitions: int, sample_pairs: int) -> None:
+    """Memoria unei rulări: interacțiuni ca liste de tupluri Action (cum le ține
+    axelrod) vs. arhiva binară deschisă prin memory-mapping."""
+    rng = random.Random(0)
+    pairs = [(i, j) for i in range(players) for j in range(i + 1, players)]
+    actions = (axl.Action.C, axl.Action.D)
+
+    # listele axelrod pentru toate perechile nu încap în memorie: măsurăm un eșantion
+    tracemalloc.start()
+    sample = {
+        pair: [[(rng.choice(actions), rng.choice(actions)) for _ in range(turns)] for _ in range(repetitions)]
+        for pair in pairs[:sample_pairs]
+    }
+    in_memory = tracemalloc.get_traced_memory()[0] / len(sample) * len(pairs)
+    tracemalloc.stop()
+    del sample
+
+    encoded = {
+        pair: ["".join(rng.choice("0123") for _ in range(turns))] * repetitions for pair in pairs
+    }
+    results = PairwiseResults([f"P{i}" for i in range(players)], encoded, repetitions, TRUST_GAME)
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = pathlib.Path(tmp)
+        (run_id, save_time) = _timed(save_run, results, turns, TRUST_GAME, directory=directory)
+        tracemalloc.start()
+        run, open_time = _timed(StoredRun, run_id, directory)
+        _, pair_time = _timed(run.interactions, players - 2, players - 1)
+        opened = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        on_disk = run.nbytes
+
+    print(f"{players} jucători, {turns} runde, {repetitions} repetiții ({len(pairs)} perechi)")
+    print(f"liste axelrod în memorie (extrapolat din {sample_pairs} perechi): {in_memory / 2**20:,.0f} MiB")
+    print(f"arhivă pe disc: {on_disk / 2**20:,.1f} MiB (salvare {save_time:.1f}s)")
+    print(f"deschidere mmap: {open_time * 1000:.1f} ms, {opened / 2**20:.2f} MiB alocați; "
+          f"o pereche: {pair_time * 1000:.2f} ms")
+
+
+# --------------------------------------------------------------------------- #
+def bench_evolution(players: int, turns: int, generations: int, population: int, runs: int) -> None:
+    """Matricea de plăți se calculează o dată; generațiile nu mai joacă meciuri."""
+    roster = synthetic_players(players)
+    names = [str(p) for p in roster]
+    matrix, matrix_time = _timed(payoff_matrix, roster, turns=turns, repetitions=1, seed=0, processes=0)
+    eco, eco_time = _timed(ecological, matrix, names, generations=generations)
+    mor, moran_time = _timed(moran, matrix, names, population=population, generations=generations, runs=runs, seed=0)
+    print(f"{players} jucători, {turns} runde")
+    print(f"matricea de plăți: {matrix_time:.1f}s")
+    print(f"ecologic: {generations} generații în {eco_time:.2f}s · câștigător {eco.iloc[-1].idxmax()}")
+    print(f"Moran: {generations} generații × {population} indivizi × {runs} simulări în {moran_time:.2f}s · "
+          f"câștigător {mor.iloc[-1].idxmax()}")
+
+
+# --------------------------------------------------------------------------- #
+def bench_pipeline(sizes: List[int], turns: int, repetitions: int, processes: int, fast: bool) -> None:
+    """Lanțul din tab-ul Turneu, etapă cu etapă, cu tracemalloc activ."""
+    print(f"{turns} runde, {repetitions} repetiții, {processes} procese, motor rapid: {'da' if fast else 'nu'}")
+    print(f"{'jucători':>9} {'etapă':<34} {'secunde':>9} {'MiB max':>9}")
+    for n in sizes:
+        profiler = Profiler(memory=True)
+        with tempfile.TemporaryDirectory() as tmp:
+            synthetic_strategy_files(n, pathlib.Path(tmp))
+            with profiler.span("încărcare (StrategyRegistry)"):
+                players = [cls() for cls in StrategyRegistry(pathlib.Path(tmp)).player_classes()]
+        with profiler.span("joc (stream_tournament)"):
+            for progress in stream_tournament(
+                players, turns, repetitions, TRUST_GAME, seed=0, processes=processes, fast=fast
+            ):
+                pass
+        results = progress.results
+        with profiler.span("summarise()"):
+            results.summarise()
+        with profiler.span("DataFrame (standings_frame + vederi)"):
+            _new_tables(results)
+        for span in profiler.spans:
+            print(f"{n:>9} {span['Etapă']:<34} {span['Secunde']:>9.3f} {span['Memorie maximă (MiB)']:>9.2f}")
+
+
+# --------------------------------------------------------------------------- #
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    scaling = sub.add_parser("scaling", help="timp de rulare vs. număr de procese")
+    scaling.add_argument("--players", type=int, default=40)
+    scaling.add_argument("--turns", type=int, default=1000)
+    scaling.add_argument("--repetitions", type=int, default=20)
+    scaling.add_argument("--seed", type=int, default=42)
+    scaling.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    scaling.add_argument("--fast", action="store_true", help="cu motorul NumPy, ca în tab-ul Turneu")
+
+    fast_engine = sub.add_parser("fast-engine", help="motorul NumPy vs. axl.Match")
+    fast_engine.add_argument("--turns", type=int, default=1000)
+    fast_engine.add_argument("--repetitions", type=int, default=2)
+
+    generation = sub.add_parser("generation", help="debitul cozii de generare LLM")
+    generation.add_argument("--submissions", type=int, default=30)
+    generation.add_argument("--concurrency", type=int, default=4)
+    generation.add_argument("--latency", type=float, default=2.0)
+    generation.add_argument("--failure-rate", type=float, default=0.2)
+
+    metastore = sub.add_parser("metastore", help="test de stres cu scrieri paralele în MetaStore")
+    metastore.add_argument("--writers", type=int, default=16)
+    metastore.add_argument("--records", type=int, default=200)
+
+    summary = sub.add_parser("summary", help="construirea clasamentelor din rezultate")
+    summary.add_argument("--sizes", type=int, nargs="+", default=[50, 200])
+    summary.add_argument("--turns", type=int, default=20)
+    summary.add_argument("--repetitions", type=int, default=2)
+
+    memory = sub.add_parser("memory", help="memoria interacțiunilor: axelrod vs. arhiva binară")
+    memory.add_argument("--players", type=int, default=100)
+    memory.add_argument("--turns", type=int, default=1000)
+    memory.add_argument("--repetitions", type=int, default=20)
+    memory.add_argument("--sample-pairs", type=int, default=20)
+
+    evolution = sub.add_parser("evolution", help="dinamica ecologică și Moran pe matricea de plăți")
+    evolution.add_argument("--players", type=int, default=30)
+    evolution.add_argument("--turns", type=int, default=200)
+    evolution.add_argument("--generations", type=int, default=2000)
+    evolution.add_argument("--population", type=int, default=100)
+    evolution.add_argument("--runs", type=int, default=20)
+
+    pipeline = sub.add_parser("pipeline", help="timp și memorie per etapă pe strategii sintetice")
+    pipeline.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 200])
+    pipeline.add_argument("--turns", type=int, default=200)
+    pipeline.add_argument("--repetitions", type=int, default=5)
+    pipeline.add_argument("--workers", type=int, default=1, help="1 = serial (memoria include și jocul)")
+    pipeline.add_argument("--no-fast", action="store_true", help="fără motorul NumPy")
+
+    args = parser.parse_args(argv)
+    if args.command == "scaling":
+        bench_scaling(args.players, args.turns, args.repetitions, args.seed, args.max_workers, args.fast)
+    elif args.command == "fast-engine":
+        bench_fast_engine(args.turns, args.repetitions)
+    elif args.command == "generation":
+        bench_generation(args.submissions, args.concurrency, args.latency, args.failure_rate)
+    elif args.command == "metastore":
+        bench_metastore(args.writers, args.records)
+    elif args.command == "summary":
+        bench_summary(args.sizes, args.turns, args.repetitions)
+    elif args.command == "memory":
+        bench_memory(args.players, args.turns, args.repetitions, args.sample_pairs)
+    elif args.command == "evolution":
+        bench_evolution(args.players, args.turns, args.generations, args.population, args.runs)
+    elif args.command == "pipeline":
+        bench_pipeline(args.sizes, args.turns, args.repetitions, args.workers, not args.no_fast)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Linie de comandă pentru arenă, fără Streamlit:
+
+• tournament – turneul strategiilor din strategies/ (opțional salvat în arhivă,
+               ca tab-ul „📁 Arhivă” să doar afișeze rezultatul)
+• sweep      – grila de parametri din sweep.py
+• validate   – validează fișierele din strategies/ (exit code 1 dacă unul e invalid)
+
+Rezultatele se scriu ca .json, .parquet sau .csv (după extensia lui --output),
+altfel ca JSON la stdout.
+
+Rulează cu:   python cli.py tournament --workers 0 --output clasament.parquet --archive
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import pathlib
+import sys
+from typing import List
+
+import axelrod as axl
+import pandas as pd
+
+CLASSICS = [axl.TitForTat, axl.Defector, axl.Cooperator]
+
+
+def _write(frame: pd.DataFrame, output: str | None) -> None:
+    if output is None:
+        print(frame.to_json(orient="records", force_ascii=False, indent=2))
+        return
+    path = pathlib.Path(output)
+    if path.suffix == ".parquet":
+        frame.to_parquet(path, index=False)  # necesită pyarrow sau fastparquet
+    elif path.suffix == ".csv":
+        frame.to_csv(path, index=False)
+    else:
+        frame.to_json(path, orient="records", force_ascii=False, indent=2)
+    print(f"{len(frame)} rânduri scrise în {path}", file=sys.stderr)
+
+
+def _players(classics: bool) -> List[axl.Player]:
+    from utils import REGISTRY, load_players
+
+    players = load_players(extra_players=[cls() for cls in CLASSICS] if classics else [])
+    for file_name, error in REGISTRY.errors().items():
+        print(f"sărit: {file_name}: {error}", file=sys.stderr)
+    return players
+
+
+def _numbers(text: str, kind=float) -> List[float]:
+    return [kind(x) for x in text.split(",") if x.strip()]
+
+
+def _payoffs(text: str) -> tuple:
+    """Tipul argumentului --payoffs: exact patru numere R,S,T,P."""
+    try:
+        values = _numbers(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{text!r} nu e o listă de numere R,S,T,P")
+    if len(values) != 4:
+        raise argparse.ArgumentTypeError(f"{text!r} are {len(values)} numere; trebuie exact 4 (R,S,T,P)")
+    return tuple(values)
+
+
+# --------------------------------------------------------------------------- #
+def cmd_tournament(args) -> int:
+    from engine import PairStore, stream_tournament
+    from standings import standings_frame
+    from utils import TRUST_GAME, get_team_mapping
+
+    players = _players(args.classics)
+    if len(players) < 2:
+        print("Ai nevoie de cel puțin două strategii.", file=sys.stderr)
+        return 1
+    params = dict(
+        turns=args.turns, repetitions=args.repetitions, game=TRUST_GAME,
+        noise=args.noise, processes=args.workers, seed=args.seed,
+    )
+    if args.isolated:
+        from sandbox import run_sandboxed
+
+        results = run_sandboxed(players, **params)
+        for name, reason in results.disqualified.items():
+            print(f"descalificată: {name}: {reason}", file=sys.stderr)
+        for pair, reason in results.errors.items():
+            print(f"pereche lipsă (eroare internă): {pair}: {reason}", file=sys.stderr)
+    else:
+        for progress in stream_tournament(
+            players, store=None if args.no_cache else PairStore(),
+            fast=not args.no_fast, dedupe=not args.no_dedupe, **params,
+        ):
+            print(f"\r{progress.done}/{progress.total} perechi", end="", file=sys.stderr)
+        print(file=sys.stderr)
+        results = progress.results
+
+    teams = get_team_mapping()
+    if args.archive:
+        from archive import save_run
+
+        run_id = save_run(
+            results, args.turns, TRUST_GAME,
+            params={k: v for k, v in params.items() if k != "game"}, teams=teams,
+        )
+        print(f"salvat în arhivă: {run_id}", file=sys.stderr)
+    _write(standings_frame(results, teams), args.output)
+    return 0
+
+
+def cmd_sweep(args) -> int:
+    from engine import PairStore
+    from sweep import grid, iter_sweep, stability
+    from utils import get_team_mapping
+
+    players = _players(args.classics)
+    cells = grid(
+        noises=_numbers(args.noise),
+        turns=_numbers(args.turns, int),
+        repetitions=_numbers(args.repetitions, int),
+        payoffs=args.payoffs,
+    )
+    parts = []
+    for part in iter_sweep(
+        players, cells, seed=args.seed, processes=args.workers,
+        store=PairStore(), teams=get_team_mapping(),
+    ):
+        parts.append(part)
+        print(f"\r{len(parts)}/{len(cells)} celule", end="", file=sys.stderr)
+    print(file=sys.stderr)
+    table = pd.concat(parts, ignore_index=True)
+    print(stability(table).to_string(index=False), file=sys.stderr)
+    _write(table, args.output)
+    return 0
+
+
+def cmd_validate(args) -> int:
+    from utils import REGISTRY
+
+    records = REGISTRY.refresh()
+    rows = [record.as_row() for record in records]
+    _write(pd.DataFrame(rows, columns=["Fișier", "Clasă", "Încărcare (ms)", "Hash", "Eroare"]), args.output)
+    return 1 if any(not record.ok for record in records) else 0
+
+
+# --------------------------------------------------------------------------- #
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def common(p):
+        p.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="0 = toate nucleele, 1 = serial")
+        p.add_argument("--seed", type=int, default=42)
+        p.add_argument("--classics", action="store_true", help="adaugă TitForTat, Defector, Cooperator")
+        p.add_argument("--output", help="fișier .json / .parquet / .csv (implicit: JSON la stdout)")
+
+    tournament = sub.add_parser("tournament", help="rulează turneul și scrie clasamentul")
+    common(tournament)
+    tournament.add_argument("--turns", type=int, default=200)
+    tournament.add_argument("--repetitions", type=int, default=5)
+    tournament.add_argument("--noise", type=float, default=0.0)
+    tournament.add_argument("--isolated", action="store_true", help="fiecare pereche într-un proces separat")
+    tournament.add_argument("--no-cache", action="store_true", help="nu refolosi perechile din PairStore")
+    tournament.add_argument("--no-fast", action="store_true", help="fără motorul NumPy")
+    tournament.add_argument("--no-dedupe", action="store_true", help="joacă și strategiile identice separat")
+    tournament.add_argument("--archive", action="store_true", help="salvează rularea în strategies/.runs")
+
+    sweep = sub.add_parser("sweep", help="grila zgomot × runde × repetiții × plăți")
+    common(sweep)
+    sweep.add_argument("--noise", default="0", help="listă separată prin virgulă, de ex. 0,0.01,0.05")
+    sweep.add_argument("--turns", default="200")
+    sweep.add_argument("--repetitions", default="5")
+    sweep.add_argument("--payoffs", action="append", type=_payoffs, metavar="R,S,T,P",
+                       help="un joc (se poate repeta); implicit jocul arenei 2,-1,3,0")
+
+    validate = sub.add_parser("validate", help="validează strategiile din strategies/")
+    validate.add_argument("--output", help="fișier .json / .parquet / .csv (implicit: JSON la stdout)")
+
+    args = parser.parse_args(argv)
+    commands = {"tournament": cmd_tournament, "sweep": cmd_sweep, "validate": cmd_validate}
+    return commands[args.command](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
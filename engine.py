@@ -0,0 +1,531 @@
+"""
+Motor de turneu pe perechi, folosit pentru turneele incrementale:
+• player_key      – amprenta unei strategii (hash-ul fișierului sau numele din axelrod)
+• PairStore       – rezultatele fiecărei perechi, salvate pe disc
+• play_pair       – joacă toate repetițiile unei perechi
+• stream_tournament – turneul pereche cu pereche, cu progres și clasament parțial
+                    (opțional cu strategiile identice jucate o singură dată)
+• run_incremental – joacă doar perechile lipsă și construiește clasamentul
+                    (opțional cu motorul NumPy din vectorized.py)
+• PairwiseResults – clasamentul, cu aceeași interfață ca axelrod.Result (summarise, scores, …)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import multiprocessing
+import os
+import statistics
+import tempfile
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+import axelrod as axl
+
+from utils import STRATEGY_DIR, TRUST_GAME
+
+C, D = axl.Action.C, axl.Action.D
+
+# o rundă = un caracter: "0"=CC, "1"=CD, "2"=DC, "3"=DD (din perspectiva primului jucător)
+_ENCODE = {(C, C): "0", (C, D): "1", (D, C): "2", (D, D): "3"}
+_FLIP = str.maketrans("12", "21")
+
+RESULTS_DIR = STRATEGY_DIR / ".pairs"
+
+# aceleași câmpuri (și ordine) ca rândurile din axelrod.Result.summarise()
+SummaryRow = namedtuple(
+    "SummaryRow",
+    [
+        "Rank", "Name", "Median_score", "Cooperation_rating", "Wins",
+        "Initial_C_rate", "CC_rate", "CD_rate", "DC_rate", "DD_rate",
+    ],
+)
+
+Interactions = List[str]  # câte un șir codificat pentru fiecare repetiție
+
+
+# --------------------------------------------------------------------------- #
+def player_key(player: axl.Player) -> str:
+    """Hash stabil al strategiei: conținutul fișierului pentru strategiile echipelor,
+    versiunea axelrod + repr-ul jucătorului pentru strategiile din bibliotecă."""
+    source_hash = getattr(player, "_source_hash", None)
+    if source_hash:
+        return source_hash
+    return hashlib.sha256(f"axelrod-{axl.__version__}:{player!r}".encode()).hexdigest()
+
+
+def encode_interactions(interactions: Sequence[Tuple[axl.Action, axl.Action]]) -> str:
+    """Transformă lista de runde [(C, D), …] într-un șir compact."""
+    return "".join(_ENCODE[play] for play in interactions)
+
+
+def flip(encoded: str) -> str:
+    """Același meci, văzut din perspectiva celuilalt jucător."""
+    return encoded.translate(_FLIP)
+
+
+def pair_seed(seed: int | None, key_a: str, key_b: str) -> int | None:
+    """Seed-ul unei perechi depinde doar de cei doi jucători, nu de restul turneului."""
+    if seed is None:
+        return None
+    digest = hashlib.sha256(f"{seed}:{key_a}:{key_b}".encode()).hexdigest()
+    return int(digest[:8], 16)
+
+
+# --------------------------------------------------------------------------- #
+class PairStore:
+    """Rezultatele perechilor, câte un fișier JSON pentru fiecare cheie.
+
+    Cheia conține hash-urile celor doi jucători și parametrii de care depind
+    mutările (runde, zgomot, seed), deci o strategie modificată primește automat
+    perechi noi. Plățile intră în cheie doar dacă una din strategii folosește
+    jocul (vezi `uses_game`); altfel aceleași mutări se punctează sub orice
+    (R, S, T, P). Repetițiile nu intră în cheie: repetiția `k` are seed-ul
+    `seed + k`, deci primele `r` dintr-o intrare mai lungă sunt valabile pentru `r`.
+    """
+
+    def __init__(self, directory=RESULTS_DIR):
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(key_a: str, key_b: str, turns: int, noise: float, seed: int | None,
+            game: axl.Game | None = None) -> str:
+        """`game` doar pentru perechile în care cel puțin un jucător folosește jocul."""
+        # axelrod întoarce np.int64 din RPST(), pe care json nu îl serializează
+        payoffs = None if game is None else [float(x) for x in game.RPST()]
+        params = [key_a, key_b, turns, noise, seed, payoffs]
+        return hashlib.sha256(json.dumps(params).encode()).hexdigest()
+
+    def get(self, key: str) -> Interactions | None:
+        path = self.directory / f"{key}.json"
+        if not path.exists():
+            return None
+        return json.loads(path.read_text())["interactions"]
+
+    def put(self, key: str, interactions: Interactions) -> None:
+        # scriere atomică: alt proces nu vede niciodată un fișier pe jumătate scris
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as fh:
+            json.dump({"interactions": interactions}, fh)
+        os.replace(tmp, self.directory / f"{key}.json")
+
+
+def uses_game(player: axl.Player) -> bool:
+    """Mutările pot depinde de plăți: `makes_use_of` declarat sau, altfel, dedus
+    de axelrod din sursa strategiei; dacă nici asta nu merge, presupunem că da."""
+    makes_use_of = player.classifier.get("makes_use_of")
+    if makes_use_of is None:
+        try:
+            makes_use_of = axl.Classifiers["makes_use_of"](player)
+        except Exception:
+            return True
+    return "game" in makes_use_of
+
+
+# --------------------------------------------------------------------------- #
+def _timed(player: axl.Player, side: int, timings: List[float]) -> axl.Player:
+    """Cronometrează fiecare apel `player.strategy` (pentru profilare)."""
+    original = player.strategy
+
+    def strategy(opponent):
+        start = time.perf_counter()
+        try:
+            return original(opponent)
+        finally:
+            timings[side] += time.perf_counter() - start
+
+    player.strategy = strategy
+    return player
+
+
+def play_pair(
+    player_a: axl.Player,
+    player_b: axl.Player,
+    turns: int,
+    repetitions: int,
+    game: axl.Game,
+    noise: float = 0,
+    seed: int | None = None,
+    timings: List[float] | None = None,
+) -> Interactions:
+    """Joacă `repetitions` meciuri între cei doi jucători (din perspectiva lui A).
+
+    Cu `timings` = [0.0, 0.0], adună acolo timpul petrecut în strategy() de A și de B.
+    """
+    out: Interactions = []
+    for rep in range(repetitions):
+        pair = (player_a.clone(), player_b.clone())
+        if timings is not None:
+            pair = tuple(_timed(player, side, timings) for side, player in enumerate(pair))
+        match = axl.Match(
+            pair,
+            turns=turns,
+            game=game,
+            noise=noise,
+            seed=None if seed is None else seed + rep,
+        )
+        out.append(encode_interactions(match.play()))
+    return out
+
+
+# jucătorii sunt moșteniți prin fork, deci clasele încărcate dinamic nu trebuie serializate;
+# globalul se setează doar în procesele din pool, prin initializer
+_WORKER_PLAYERS: List[axl.Player] = []
+
+
+def _init_worker(players: List[axl.Player]) -> None:
+    global _WORKER_PLAYERS
+    _WORKER_PLAYERS = players
+
+
+def _run_task(players: List[axl.Player], task: tuple, timed: bool):
+    i, j, turns, repetitions, game, noise, seed = task
+    if not timed:
+        return play_pair(players[i], players[j], turns, repetitions, game, noise, seed)
+    timings = [0.0, 0.0]
+    played = play_pair(players[i], players[j], turns, repetitions, game, noise, seed, timings)
+    return played, timings
+
+
+def _play_task(task):
+    return _run_task(_WORKER_PLAYERS, task, timed=False)
+
+
+def _play_task_timed(task):
+    return _run_task(_WORKER_PLAYERS, task, timed=True)
+
+
+def iter_play_pairs(
+    players: List[axl.Player],
+    tasks: List[tuple],
+    processes: int | None = None,
+    timed: bool = False,
+) -> Iterator[Tuple[int, Interactions]]:
+    """Joacă perechile (i, j, turns, repetitions, game, noise, seed), serial sau
+    pe un pool de procese, și le produce (indice task, interacțiuni) pe măsură
+    ce se termină. Dacă generatorul e închis, perechile neîncepute se anulează.
+    Cu `timed=True` produce (indice task, (interacțiuni, [secunde A, secunde B]))."""
+    if processes == 0:
+        processes = os.cpu_count() or 1
+    if not processes or processes == 1 or len(tasks) < 2 or "fork" not in multiprocessing.get_all_start_methods():
+        # serial: jucătorii se dau direct, fără globalul workerilor, pe care
+        # l-ar suprascrie orice alt turneu pornit din același proces
+        for k, task in enumerate(tasks):
+            yield k, _run_task(players, task, timed)
+        return
+
+    run = _play_task_timed if timed else _play_task
+
+    pool = ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=_init_worker,
+        initargs=(players,),
+    )
+    try:
+        futures = {pool.submit(run, task): k for k, task in enumerate(tasks)}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+# --------------------------------------------------------------------------- #
+class PairwiseResults:
+    """Clasamentul construit din interacțiunile perechilor.
+
+    Expune același subset din axelrod.Result folosit de app.py: players,
+    scores, normalised_scores, wins, cooperating_rating, ranking,
+    ranked_names și summarise(). Ca și în axelrod, meciurile unui jucător
+    cu el însuși nu intră în statistici.
+
+    Perechile se pot adăuga și pe rând, cu `add()`: clasamentul parțial
+    se actualizează incremental, fără a reparcurge perechile deja adăugate.
+    """
+
+    def __init__(
+        self,
+        players: List[str],
+        interactions: Dict[Tuple[int, int], Interactions],
+        repetitions: int,
+        game: axl.Game,
+    ):
+        self.players = players
+        self.num_players = n = len(players)
+        self.repetitions = repetitions
+        self.interactions: Dict[Tuple[int, int], Interactions] = {}
+        self._payoffs = game.RPST()
+
+        self.scores = [[0.0] * repetitions for _ in range(n)]
+        self._score_per_turn = [[0.0] * repetitions for _ in range(n)]
+        self.wins = [[0] * repetitions for _ in range(n)]
+        self._cooperations = [0] * n
+        self._initial_cooperations = [0] * n
+        self._turns_played = [0] * n
+        self._matches_played = [0] * n
+        self._states = [[0, 0, 0, 0] for _ in range(n)]
+
+        for pair, reps in interactions.items():
+            self.add(pair[0], pair[1], reps, update=False)
+        self._update()
+
+    def add(self, i: int, j: int, reps: Interactions, update: bool = True) -> None:
+        """Adaugă meciurile perechii (i, j), codificate din perspectiva lui i."""
+        self.interactions[(i, j)] = reps
+        if i == j:
+            return
+        R, P, S, T = self._payoffs
+        for rep, encoded in enumerate(reps):
+            cc, cd, dc, dd = (encoded.count(s) for s in "0123")
+            length = len(encoded)
+            score_i = R * cc + S * cd + T * dc + P * dd
+            score_j = R * cc + T * cd + S * dc + P * dd
+            for me, score, other, mine in (
+                (i, score_i, score_j, (cc, cd, dc, dd)),
+                (j, score_j, score_i, (cc, dc, cd, dd)),
+            ):
+                self.scores[me][rep] += score
+                if length:
+                    self._score_per_turn[me][rep] += score / length
+                if score > other:
+                    self.wins[me][rep] += 1
+                self._cooperations[me] += mine[0] + mine[1]
+                self._turns_played[me] += length
+                self._matches_played[me] += 1
+                for k in range(4):
+                    self._states[me][k] += mine[k]
+            self._initial_cooperations[i] += encoded[:1] in ("0", "1")
+            self._initial_cooperations[j] += encoded[:1] in ("0", "2")
+        if update:
+            self._update()
+
+    def _update(self) -> None:
+        """Recalculează mărimile derivate (O(jucători × repetiții))."""
+        n = self.num_players
+        opponents = max(n - 1, 1)
+        self.normalised_scores = [[s / opponents for s in row] for row in self._score_per_turn]
+        self.cooperating_rating = [
+            self._cooperations[i] / self._turns_played[i] if self._turns_played[i] else 0 for i in range(n)
+        ]
+        self.initial_cooperation_rate = [
+            self._initial_cooperations[i] / self._matches_played[i] if self._matches_played[i] else 0
+            for i in range(n)
+        ]
+        self.state_rates = [
+            [count / self._turns_played[i] if self._turns_played[i] else 0 for count in self._states[i]]
+            for i in range(n)
+        ]
+        self.median_scores = [statistics.median(row) for row in self.normalised_scores]
+        self.ranking = sorted(range(n), key=lambda i: -self.median_scores[i])
+        self.ranked_names = [self.players[i] for i in self.ranking]
+
+    def summarise(self) -> List[SummaryRow]:
+        return [
+            SummaryRow(
+                rank,
+                self.players[i],
+                self.median_scores[i],
+                self.cooperating_rating[i],
+                statistics.median(self.wins[i]),
+                self.initial_cooperation_rate[i],
+                *self.state_rates[i],
+            )
+            for rank, i in enumerate(self.ranking)
+        ]
+
+
+# --------------------------------------------------------------------------- #
+class Progress:
+    """Starea unui turneu în desfășurare, produsă de `stream_tournament`."""
+
+    def __init__(self, results: PairwiseResults, done: int, total: int, started: float):
+        self.results = results  # clasamentul parțial (sau final, când done == total)
+        self.done = done
+        self.total = total
+        self.elapsed = time.monotonic() - started
+
+    @property
+    def fraction(self) -> float:
+        return self.done / self.total if self.total else 1.0
+
+    @property
+    def rate(self) -> float:
+        """Perechi terminate pe secundă."""
+        return self.done / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> float | None:
+        """Secunde estimate până la final."""
+        if self.done == self.total:
+            return 0.0
+        return (self.total - self.done) / self.rate if self.rate else None
+
+
+def stream_tournament(
+    players: List[axl.Player],
+    turns: int = 200,
+    repetitions: int = 5,
+    game: axl.Game | None = None,
+    noise: float = 0,
+    seed: int | None = None,
+    processes: int | None = None,
+    store: PairStore | None = None,
+    fast: bool = False,
+    cancel: threading.Event | None = None,
+    timings: Dict[int, List[float]] | None = None,
+    dedupe: bool = False,
+) -> Iterator[Progress]:
+    """Turneu round-robin care produce un `Progress` după fiecare pereche terminată.
+
+    Cu un `store`, perechile deja salvate nu se mai joacă (turneu incremental).
+    Cu `fast=True` (și fără zgomot), perechile de jucători determiniști cu
+    memorie mică se joacă vectorizat, cu scoruri identice.
+    Turneul se oprește dacă `cancel` e setat sau dacă generatorul e închis.
+    Ultimul `Progress.results` are atributele `played_pairs` și `cached_pairs`.
+    Cu un dicționar `timings` (profilare), toate perechile se joacă cu axl.Match,
+    fără PairStore, motorul NumPy sau dedupe, ca fiecare jucător să fie cronometrat;
+    acolo se adună {indice jucător: [secunde în strategy(), mutări]}.
+    Cu `dedupe=True`, jucătorii cu același tabel de tranziții (identitate dovedită,
+    vezi fingerprint.py) împart meciurile contra altor jucători cu identitate dovedită
+    (nu și contra celor stocastici), dar apar separat în clasament.
+    """
+    started = time.monotonic()
+    game = game or TRUST_GAME
+    if timings is not None:
+        # perechile din cache sau jucate vectorizat nu ar avea timpi per mutare
+        store, fast, dedupe = None, False, False
+    source = [player_key(p) for p in players]
+    if dedupe:
+        from fingerprint import behaviour_keys
+
+        shared = behaviour_keys(players, turns, game)
+    else:
+        shared = source
+
+    from fingerprint import is_deterministic
+
+    # fără zgomot, un meci între doi jucători determiniști e același la fiecare repetiție
+    # și cu orice seed: se joacă și se salvează o singură repetiție
+    deterministic = [noise == 0 and is_deterministic(p) for p in players]
+    game_aware = [uses_game(p) for p in players]
+
+    def keys_of(i: int, j: int) -> Tuple[str, str]:
+        # meciurile se împart doar între perechi complet deterministe; contra unui
+        # adversar stocastic fiecare jucător își păstrează propriul eșantion
+        if shared[i].startswith("tt:") and shared[j].startswith("tt:"):
+            return shared[i], shared[j]
+        return source[i], source[j]
+
+    # (cheia perechii, True dacă perechea e salvată din perspectiva lui j) → perechile (i, j)
+    pairs: Dict[Tuple[str, bool], List[Tuple[int, int]]] = {}
+    found: Dict[str, Interactions] = {}
+    missing: Dict[str, Tuple[int, int, str, str]] = {}  # cheie → (a, b, cheia lui a, cheia lui b)
+    fixed: set = set()  # cheile perechilor deterministe (o singură repetiție salvată)
+    for i in range(len(players)):
+        for j in range(i + 1, len(players)):
+            key_i, key_j = keys_of(i, j)
+            # ordinea canonică a cheilor face ca (A, B) și (B, A) să fie aceeași pereche
+            swap = key_i > key_j
+            a, b, key_a, key_b = (j, i, key_j, key_i) if swap else (i, j, key_i, key_j)
+            same = deterministic[i] and deterministic[j]
+            store_key = PairStore.key(
+                key_a, key_b, turns, noise, None if same else seed,
+                game if game_aware[i] or game_aware[j] else None,
+            )
+            pairs.setdefault((store_key, swap), []).append((i, j))
+            if store_key in found or store_key in missing:
+                continue
+            if same:
+                fixed.add(store_key)
+            cached = store.get(store_key) if store is not None else None
+            if cached and same:
+                found[store_key] = [cached[0]] * repetitions
+            elif cached is not None and len(cached) >= repetitions:
+                found[store_key] = cached[:repetitions]
+            else:  # lipsește sau are prea puține repetiții: se rejoacă și se suprascrie
+                missing[store_key] = (a, b, key_a, key_b)
+
+    results = PairwiseResults([str(p) for p in players], {}, repetitions, game)
+    results.played_pairs = len(missing)
+    results.cached_pairs = len(found)
+    total = sum(len(v) for v in pairs.values())
+    done = 0
+
+    def complete(store_key: str, played: Interactions, fresh: bool) -> int:
+        if store_key in fixed:
+            if fresh and store is not None:
+                store.put(store_key, played[:1])
+            played = [played[0]] * repetitions
+        elif fresh and store is not None:
+            store.put(store_key, played)
+        added = 0
+        for swap in (False, True):
+            for i, j in pairs.get((store_key, swap), ()):
+                results.add(i, j, [flip(e) for e in played] if swap else played, update=False)
+                added += 1
+        return added
+
+    for store_key, played in found.items():
+        done += complete(store_key, played, fresh=False)
+    results._update()
+    yield Progress(results, done, total, started)
+
+    if fast and noise == 0 and missing:
+        from vectorized import FastEngine
+
+        engine = FastEngine(players, turns, game)
+        batch = {k: m[:2] for k, m in missing.items() if engine.supports(m[0]) and engine.supports(m[1])}
+        # determinist ⇒ toate repetițiile sunt identice
+        for store_key, encoded in zip(batch, engine.play(list(batch.values()))):
+            done += complete(store_key, [encoded], fresh=True)
+            del missing[store_key]
+        results._update()
+        yield Progress(results, done, total, started)
+
+    slow = list(missing)
+    tasks = [
+        (a, b, turns, 1 if store_key in fixed else repetitions, game, noise, pair_seed(seed, key_a, key_b))
+        for store_key, (a, b, key_a, key_b) in missing.items()
+    ]
+    for k, played in iter_play_pairs(players, tasks, processes, timed=timings is not None):
+        if cancel is not None and cancel.is_set():
+            return
+        if timings is not None:
+            played, seconds = played
+            moves = sum(len(e) for e in played)
+            for side in (0, 1):
+                entry = timings.setdefault(tasks[k][side], [0.0, 0])
+                entry[0] += seconds[side]
+                entry[1] += moves
+        done += complete(slow[k], played, fresh=True)
+        results._update()
+        yield Progress(results, done, total, started)
+
+
+def run_incremental(
+    players: List[axl.Player],
+    turns: int = 200,
+    repetitions: int = 5,
+    game: axl.Game | None = None,
+    noise: float = 0,
+    seed: int | None = None,
+    processes: int | None = None,
+    store: PairStore | None = None,
+    fast: bool = False,
+) -> PairwiseResults:
+    """Turneu round-robin care joacă doar perechile care lipsesc din `store`.
+
+    La o strategie nouă se joacă doar cele N meciuri noi, nu toate N×N.
+    Vezi `stream_tournament` pentru `fast` și pentru progresul pe parcurs.
+    """
+    progress = None
+    for progress in stream_tournament(
+        players, turns, repetitions, game, noise, seed, processes, store or PairStore(), fast
+    ):
+        pass
+    return progress.results
@@ -0,0 +1,132 @@
+"""
+Populații care evoluează din strategiile trimise:
+• payoff_matrix – scorul mediu pe rundă al fiecărei strategii contra fiecărei
+                  alteia (inclusiv contra ei înseși), calculat o singură dată
+• ecological    – dinamica replicatorului (ca axl.Ecosystem): ponderea unei
+                  strategii crește proporțional cu scorul ei în populația curentă
+• moran         – procesul Moran pe o populație finită: la fiecare pas un
+                  individ se reproduce (proporțional cu fitness-ul) și unul moare
+
+Ambele dinamici lucrează doar cu matricea de plăți, vectorizat în NumPy, fără
+a mai juca meciuri, deci mii de generații durează câteva secunde.
+"""
+
+from __future__ import annotations
+
+from typing import List
+
+import axelrod as axl
+import numpy as np
+import pandas as pd
+
+from engine import PairStore, iter_play_pairs, pair_seed, player_key, stream_tournament
+from utils import TRUST_GAME
+
+
+# --------------------------------------------------------------------------- #
+def payoff_matrix(
+    players: List[axl.Player],
+    turns: int = 200,
+    repetitions: int = 5,
+    game: axl.Game | None = None,
+    seed: int | None = None,
+    processes: int | None = None,
+    store: PairStore | None = None,
+    fast: bool = True,
+) -> np.ndarray:
+    """A[i, j] = scorul mediu pe rundă al lui i contra lui j.
+
+    Perechile distincte vin din motorul de turneu (și din `store`, dacă au
+    mai fost jucate); diagonala e meciul fiecărei strategii cu o copie a ei.
+    """
+    game = game or TRUST_GAME
+    R, P, S, T = game.RPST()
+    n = len(players)
+    matrix = np.zeros((n, n))
+
+    def per_turn(reps):
+        score_a = score_b = 0.0
+        for encoded in reps:
+            cc, cd, dc, dd = (encoded.count(s) for s in "0123")
+            length = max(len(encoded), 1)
+            score_a += (R * cc + S * cd + T * dc + P * dd) / length
+            score_b += (R * cc + T * cd + S * dc + P * dd) / length
+        return score_a / len(reps), score_b / len(reps)
+
+    progress = None
+    for progress in stream_tournament(
+        players, turns, repetitions, game, 0, seed, processes, store, fast
+    ):
+        pass
+    for (i, j), reps in progress.results.interactions.items():
+        matrix[i, j], matrix[j, i] = per_turn(reps)
+
+    keys = [player_key(p) for p in players]
+    tasks = [(i, i, turns, repetitions, game, 0, pair_seed(seed, keys[i], keys[i])) for i in range(n)]
+    for i, reps in iter_play_pairs(players, tasks, processes):
+        matrix[i, i] = sum(per_turn(reps)) / 2
+    return matrix
+
+
+def _fitness_matrix(matrix: np.ndarray) -> np.ndarray:
+    """Plățile pot fi negative (S = -1); le translatăm ca fitness-ul minim să fie 1."""
+    return matrix - matrix.min() + 1.0
+
+
+# --------------------------------------------------------------------------- #
+def ecological(
+    matrix: np.ndarray,
+    names: List[str],
+    generations: int = 1000,
+    initial: np.ndarray | None = None,
+) -> pd.DataFrame:
+    """Ponderile strategiilor la fiecare generație (dinamica replicatorului
+    în timp discret): x' = x · (A x) / (xᵀ A x)."""
+    fitness = _fitness_matrix(matrix)
+    n = len(names)
+    shares = np.empty((generations + 1, n))
+    x = np.full(n, 1.0 / n) if initial is None else np.asarray(initial, dtype=float) / np.sum(initial)
+    shares[0] = x
+    for generation in range(1, generations + 1):
+        f = fitness @ x
+        x = x * f / (x @ f)
+        shares[generation] = x
+    return pd.DataFrame(shares, columns=names).rename_axis("Generație")
+
+
+def moran(
+    matrix: np.ndarray,
+    names: List[str],
+    population: int = 100,
+    generations: int = 1000,
+    runs: int = 20,
+    seed: int | None = None,
+) -> pd.DataFrame:
+    """Ponderile medii (peste `runs` simulări independente) după fiecare generație.
+
+    O generație = `population` pași Moran. Fitness-ul unui individ e scorul
+    mediu contra restului populației (fără el însuși). Toate simulările
+    avansează simultan, ca operații pe tablouri [runs, strategii].
+    """
+    rng = np.random.default_rng(seed)
+    fitness = _fitness_matrix(matrix)
+    n = len(names)
+    counts = np.full((runs, n), population // n, dtype=np.int64)
+    counts[:, : population % n] += 1
+    rows = np.arange(runs)
+
+    shares = np.empty((generations + 1, n))
+    shares[0] = counts.mean(axis=0) / population
+    for generation in range(1, generations + 1):
+        for _ in range(population):
+            # fitness-ul fiecărui tip: contra celorlalți N-1 indivizi; u ∈ (0, 1] ca
+            # un tip dispărut (pondere 0) să nu poată fi ales
+            f = (counts @ fitness.T - np.diag(fitness)) / (population - 1)
+            weights = np.cumsum(counts * f, axis=1)
+            born = (weights < (1 - rng.random((runs, 1))) * weights[:, -1:]).sum(axis=1)
+            alive = np.cumsum(counts, axis=1)
+            dead = (alive < (1 - rng.random((runs, 1))) * population).sum(axis=1)
+            np.add.at(counts, (rows, born), 1)
+            np.add.at(counts, (rows, dead), -1)
+        shares[generation] = counts.mean(axis=0) / population
+    return pd.DataFrame(shares, columns=names).rename_axis("Generație")
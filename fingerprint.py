@@ -0,0 +1,178 @@
+"""
+Amprente comportamentale ale strategiilor deterministe.
+
+Fiecare strategie joacă un meci contra fiecărui adversar din PROBES (cu
+același număr de runde și același joc ca turneul); amprenta e hash-ul
+mutărilor. Două strategii cu aceeași amprentă se pot totuși comporta diferit
+contra altor adversari, deci amprenta e doar informativă.
+
+Identitatea se consideră dovedită doar pentru strategiile eligibile pentru
+motorul NumPy, când au același tabel stare → mutare (vectorized.transition_table).
+Clonele TitForTat cu nume diferite au același tabel.
+
+• fingerprints    – amprenta fiecărui jucător (None pentru cei stocastici),
+                    din cache-ul de lângă fișierele strategiilor
+• table_keys      – hash-ul tabelului de tranziții (None dacă nu există unul verificat)
+• behaviour_keys  – cheile folosite de engine.stream_tournament(dedupe=True):
+                    jucătorii cu același tabel au aceeași cheie, deci perechile
+                    lor se joacă o singură dată, dar fiecare rămâne în clasament
+• duplicate_groups – grupurile de strategii identice, pentru tab-ul de administrare
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, List
+
+import axelrod as axl
+
+from engine import encode_interactions, player_key
+from utils import STRATEGY_DIR, TRUST_GAME
+from vectorized import MAX_MEMORY_DEPTH, is_eligible, transition_table
+
+FINGERPRINT_DIR = STRATEGY_DIR / ".fingerprints"
+
+# adversari deterministi care trec strategia prin cât mai multe istorii diferite
+PROBES = (
+    axl.Cooperator,
+    axl.Defector,
+    axl.Alternator,
+    axl.TitForTat,
+    axl.SuspiciousTitForTat,
+    axl.Grudger,
+    axl.CyclerCCD,
+    lambda: axl.Cycler("CCDCDDDCCDDCDCCC"),
+)
+PROBE_VERSION = "2"  # se schimbă odată cu PROBES, ca amprentele vechi să nu mai fie folosite
+
+
+def is_deterministic(player: axl.Player) -> bool:
+    classifier = player.classifier
+    return not (
+        classifier.get("stochastic", True)
+        or classifier.get("inspects_source", False)
+        or classifier.get("manipulates_state", False)
+        or classifier.get("manipulates_source", False)
+    )
+
+
+def fingerprint(player: axl.Player, turns: int, game: axl.Game) -> str | None:
+    """Hash-ul mutărilor contra PROBES; None dacă strategia nu e deterministă."""
+    if not is_deterministic(player):
+        return None
+    digest = hashlib.sha256()
+    try:
+        for probe in PROBES:
+            match = axl.Match((player.clone(), probe()), turns=turns, game=game)
+            digest.update(encode_interactions(match.play()).encode("ascii") + b"|")
+    except Exception:  # strategia va eșua oricum în turneu; nu o grupăm cu alta
+        return None
+    return digest.hexdigest()[:16]
+
+
+def table_key(player: axl.Player, turns: int, game: axl.Game) -> str | None:
+    """Hash-ul tabelului stare → mutare (la adâncimea MAX_MEMORY_DEPTH), sau None
+    dacă strategia nu e eligibilă pentru motorul NumPy ori tabelul nu se verifică."""
+    if not is_eligible(player):
+        return None
+    try:
+        table = transition_table(player, MAX_MEMORY_DEPTH, turns, game)
+    except Exception:
+        return None
+    if table is None:
+        return None
+    return hashlib.sha256(table.tobytes()).hexdigest()[:16]
+
+
+# --------------------------------------------------------------------------- #
+class FingerprintStore:
+    """Amprentele calculate, câte un fișier JSON per (strategie, runde, joc)."""
+
+    def __init__(self, directory=FINGERPRINT_DIR):
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(player: axl.Player, turns: int, game: axl.Game) -> str:
+        params = [player_key(player), turns, [float(x) for x in game.RPST()], PROBE_VERSION]
+        return hashlib.sha256(json.dumps(params).encode()).hexdigest()
+
+    def get(self, key: str) -> Dict[str, object] | None:
+        try:
+            return json.loads((self.directory / f"{key}.json").read_text())
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, value: Dict[str, object]) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as fh:
+            json.dump(value, fh)
+        os.replace(tmp, self.directory / f"{key}.json")
+
+
+def _records(
+    players: List[axl.Player],
+    turns: int,
+    game: axl.Game | None,
+    store: FingerprintStore | None,
+) -> List[Dict[str, object]]:
+    game = game or TRUST_GAME
+    store = store or FingerprintStore()
+    out = []
+    for player in players:
+        key = store.key(player, turns, game)
+        cached = store.get(key)
+        if cached is None:
+            cached = {"fingerprint": fingerprint(player, turns, game), "table": table_key(player, turns, game)}
+            store.put(key, cached)
+        out.append(cached)
+    return out
+
+
+def fingerprints(
+    players: List[axl.Player],
+    turns: int = 200,
+    game: axl.Game | None = None,
+    store: FingerprintStore | None = None,
+) -> List[str | None]:
+    return [record["fingerprint"] for record in _records(players, turns, game, store)]
+
+
+def table_keys(
+    players: List[axl.Player],
+    turns: int = 200,
+    game: axl.Game | None = None,
+    store: FingerprintStore | None = None,
+) -> List[str | None]:
+    return [record["table"] for record in _records(players, turns, game, store)]
+
+
+def behaviour_keys(
+    players: List[axl.Player],
+    turns: int = 200,
+    game: axl.Game | None = None,
+    store: FingerprintStore | None = None,
+) -> List[str]:
+    """Hash-ul tabelului de tranziții pentru jucătorii cu identitate dovedită,
+    player_key pentru ceilalți (inclusiv cei cu aceeași amprentă, dar fără tabel)."""
+    return [
+        f"tt:{tk}" if tk is not None else player_key(player)
+        for player, tk in zip(players, table_keys(players, turns, game, store))
+    ]
+
+
+def duplicate_groups(
+    players: List[axl.Player],
+    turns: int = 200,
+    game: axl.Game | None = None,
+    store: FingerprintStore | None = None,
+) -> Dict[str, List[str]]:
+    """{hash tabel: numele strategiilor} pentru tabelele comune la cel puțin doi jucători."""
+    groups: Dict[str, List[str]] = {}
+    for player, tk in zip(players, table_keys(players, turns, game, store)):
+        if tk is not None:
+            groups.setdefault(tk, []).append(str(player))
+    return {tk: names for tk, names in groups.items() if len(names) > 1}
@@ -0,0 +1,176 @@
+"""
+Generarea asincronă a strategiilor cu LLM:
+• GenerationQueue – coadă de job-uri cu concurență limitată și reîncercări
+                    cu backoff exponențial; UI-ul doar trimite job-ul și
+                    citește periodic starea job-urilor echipei
+• Job             – starea unei cereri (în așteptare → generare → gata / eroare)
+• FakeClient      – backend fals, cu latență și erori simulate, pentru teste
+                    și pentru măsurarea debitului (vezi `python bench.py generation`)
+
+Apelurile SDK sunt blocante, deci job-urile rulează pe un pool de thread-uri,
+nu pe thread-ul Streamlit al sesiunii.
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from utils import LLM, check_strategy_name, save_strategy
+
+PENDING, RUNNING, RETRYING, DONE, FAILED = "în așteptare", "generare", "reîncercare", "gata", "eroare"
+
+
+# --------------------------------------------------------------------------- #
+class Job:
+    """O cerere de generare a unei strategii."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, team: str, name: str, description: str, backend: str):
+        self.id = next(self._ids)
+        self.team = team.strip().lower()
+        self.name = name
+        self.description = description
+        self.backend = backend
+        self.status = PENDING
+        self.attempts = 0
+        self.error: str | None = None
+        self.file_path = None
+        self.submitted_at = time.time()
+        self.finished_at: float | None = None
+
+    def as_row(self) -> Dict[str, object]:
+        return {
+            "Strategie": self.name,
+            "Stare": self.status,
+            "Încercări": self.attempts,
+            "Fișier": self.file_path.name if self.file_path else None,
+            "Eroare": self.error,
+        }
+
+
+class GenerationQueue:
+    """Coadă de generare comună tuturor sesiunilor.
+
+    `max_concurrency` limitează câte cereri simultane ajung la API; o cerere
+    eșuată se reîncearcă de până la `max_retries` ori, cu pauze de
+    `base_delay · 2^încercare` secunde (plus jitter).
+    """
+
+    def __init__(
+        self,
+        client=LLM,
+        max_concurrency: int = 4,
+        max_retries: int = 4,
+        base_delay: float = 1.0,
+        save=save_strategy,
+    ):
+        self.client = client
+        self.save = save
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self._pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="llm")
+        self._jobs: Dict[int, Job] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, team: str, name: str, description: str, backend: str = "gemini") -> Job:
+        """Pune cererea în coadă și întoarce imediat job-ul."""
+        check_strategy_name(name)
+        job = Job(team, name, description, backend)
+        with self._lock:
+            self._jobs[job.id] = job
+        self._pool.submit(self._run, job)
+        return job
+
+    def _run(self, job: Job) -> None:
+        while True:
+            job.attempts += 1
+            job.status = RUNNING
+            try:
+                code = self.client.generate(job.backend, job.name, job.description)
+                job.file_path = self.save(job.name, code, job.team, backend=job.backend)
+                job.status, job.error = DONE, None
+                break
+            except ValueError as exc:  # cerere invalidă, nu are rost să reîncercăm
+                job.status, job.error = FAILED, str(exc)
+                break
+            except Exception as exc:
+                job.error = f"{type(exc).__name__}: {exc}"
+                if job.attempts > self.max_retries:
+                    job.status = FAILED
+                    break
+                job.status = RETRYING
+                delay = self.base_delay * 2 ** (job.attempts - 1)
+                time.sleep(delay + random.uniform(0, self.base_delay))
+        job.finished_at = time.time()
+
+    def jobs(self, team: str | None = None) -> List[Job]:
+        """Job-urile unei echipe (sau toate), cele mai noi primele."""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        if team is not None:
+            jobs = [j for j in jobs if j.team == team.strip().lower()]
+        return sorted(jobs, key=lambda j: -j.id)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Așteaptă terminarea tuturor job-urilor (pentru teste și benchmark)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while any(j.status not in (DONE, FAILED) for j in self.jobs()):
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+
+# --------------------------------------------------------------------------- #
+FAKE_STRATEGY = '''import axelrod as axl
+from axelrod import Action
+
+
+class {name}(axl.Player):
+    """Strategie generată de FakeClient (TitForTat)."""
+
+    name = "{name}"
+    classifier = {{
+        "memory_depth": 1,
+        "stochastic": False,
+        "inspects_source": False,
+        "manipulates_source": False,
+        "manipulates_state": False,
+    }}
+
+    def strategy(self, opponent: axl.Player) -> Action:
+        if not opponent.history:
+            return Action.C
+        return opponent.history[-1]
+'''
+
+
+class FakeClient:
+    """Înlocuitor pentru LLMClient: așteaptă `latency` secunde și eșuează
+    cu probabilitatea `failure_rate`, ca un API supraîncărcat."""
+
+    def __init__(self, latency: float = 0.5, failure_rate: float = 0.0, seed: int | None = None):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def generate(self, backend: str, name: str, description: str) -> str:
+        with self._lock:
+            self.calls += 1
+            fail = self._random.random() < self.failure_rate
+        time.sleep(self.latency)
+        if fail:
+            raise ConnectionError("429 Too Many Requests (simulat)")
+        return FAKE_STRATEGY.format(name=name)
+
+
+# coada folosită de app.py; supraviețuiește rerulărilor Streamlit
+QUEUE = GenerationQueue()
@@ -0,0 +1,81 @@
+"""
+Cache persistent pentru codul generat de LLM.
+
+Cheia este (backend, model, versiunea prompt-ului, descrierea normalizată,
+numele clasei); o echipă care retrimite aceeași descriere primește imediat
+codul generat data trecută, fără un nou apel la API.
+
+Fiecare intrare e un fișier JSON; data ultimei folosiri (mtime) dă ordinea
+LRU, iar la depășirea `max_entries` se șterg cele mai vechi intrări.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pathlib
+import re
+import tempfile
+import threading
+
+
+def normalize_description(description: str) -> str:
+    """Descrieri care diferă doar prin spații sau majuscule dau aceeași cheie."""
+    return re.sub(r"\s+", " ", description).strip().lower()
+
+
+class CodeCache:
+    """Cache LRU pe disc, cu contoare de hit/miss pentru procesul curent."""
+
+    def __init__(self, directory: pathlib.Path, max_entries: int = 500):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(backend: str, model: str, prompt_version: str, description: str, class_name: str) -> str:
+        params = [backend, model, prompt_version, normalize_description(description), class_name]
+        return hashlib.sha256(json.dumps(params).encode()).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        path = self.directory / f"{key}.json"
+        try:
+            code = json.loads(path.read_text(encoding="utf-8"))["code"]
+            os.utime(path)  # marchează intrarea ca folosită recent
+        except (OSError, ValueError, KeyError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return code
+
+    def put(self, key: str, code: str) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump({"code": code}, fh)
+        os.replace(tmp, self.directory / f"{key}.json")
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = sorted(self.directory.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        for path in entries[: max(0, len(entries) - self.max_entries)]:
+            path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "Intrări": len(list(self.directory.glob("*.json"))),
+            "Limită": self.max_entries,
+            "Hit": self.hits,
+            "Miss": self.misses,
+            "Rată hit": f"{self.hits / total:.0%}" if total else "-",
+        }
@@ -0,0 +1,116 @@
+"""
+Metadatele strategiilor într-o bază SQLite (mod WAL), în locul lui meta.json:
+echipa, hash-ul fișierului, backend-ul de generare, momentele creării și
+actualizării și starea validării.
+
+Fiecare scriere e o singură instrucțiune UPSERT, deci atomică; sesiunile
+Streamlit care salvează în același timp nu își mai suprascriu modificările,
+cum se întâmpla la citirea + rescrierea întregului meta.json.
+
+Cheia unei strategii e numele normalizat, la fel ca în app.py:
+`nume.strip().lower().replace(" ", "")`.
+"""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import sqlite3
+import threading
+import time
+from typing import Dict, List
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS strategies (
+    key        TEXT PRIMARY KEY,
+    name       TEXT NOT NULL,
+    team       TEXT,
+    file_hash  TEXT,
+    backend    TEXT,
+    status     TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS strategies_team ON strategies (team);
+"""
+
+
+def normalize_name(name: str) -> str:
+    return name.strip().lower().replace(" ", "")
+
+
+class MetaStore:
+    """Tabela `strategies`, cu câte o conexiune SQLite pentru fiecare thread."""
+
+    def __init__(self, path: pathlib.Path, legacy_json: pathlib.Path | None = None):
+        self.path = path
+        self._local = threading.local()
+        with self._connect() as db:
+            db.executescript(_SCHEMA)
+        if legacy_json is not None and legacy_json.exists():
+            self._import_legacy(legacy_json)
+
+    def _connect(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.row_factory = sqlite3.Row
+            self._local.db = db
+        return db
+
+    def _import_legacy(self, legacy_json: pathlib.Path) -> None:
+        """Preia o singură dată maparea {strategie: echipă} din vechiul meta.json."""
+        try:
+            for name, team in json.loads(legacy_json.read_text()).items():
+                self.upsert(name, team=team)
+            legacy_json.rename(legacy_json.with_suffix(".json.migrated"))
+        except FileNotFoundError:  # alt proces l-a migrat deja
+            pass
+
+    # ------------------------------------------------------------------ #
+    def upsert(
+        self,
+        name: str,
+        team: str | None = None,
+        file_hash: str | None = None,
+        backend: str | None = None,
+        status: str | None = None,
+    ) -> None:
+        """Creează sau actualizează strategia; câmpurile None rămân neschimbate."""
+        now = time.time()
+        self._connect().execute(
+            """
+            INSERT INTO strategies (key, name, team, file_hash, backend, status, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (key) DO UPDATE SET
+                team       = COALESCE(excluded.team, team),
+                file_hash  = COALESCE(excluded.file_hash, file_hash),
+                backend    = COALESCE(excluded.backend, backend),
+                status     = COALESCE(excluded.status, status),
+                updated_at = excluded.updated_at
+            """,
+            (normalize_name(name), name, team, file_hash, backend, status, now, now),
+        )
+
+    def team_for(self, name: str) -> str | None:
+        row = self._connect().execute(
+            "SELECT team FROM strategies WHERE key = ?", (normalize_name(name),)
+        ).fetchone()
+        return row["team"] if row else None
+
+    def team_mapping(self) -> Dict[str, str]:
+        """{nume normalizat: echipă}, pentru toate strategiile cu echipă."""
+        rows = self._connect().execute("SELECT key, team FROM strategies WHERE team IS NOT NULL")
+        return {row["key"]: row["team"] for row in rows}
+
+    def rows(self) -> List[Dict[str, object]]:
+        rows = self._connect().execute("SELECT * FROM strategies ORDER BY updated_at DESC")
+        return [dict(row) for row in rows]
+
+    def delete(self, name: str) -> None:
+        self._connect().execute("DELETE FROM strategies WHERE key = ?", (normalize_name(name),))
+
+    def clear(self) -> None:
+        self._connect().execute("DELETE FROM strategies")
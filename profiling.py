@@ -0,0 +1,66 @@
+"""
+Profilarea lanțului unui turneu: încărcare → joc → summarise() → DataFrame.
+
+• Profiler  – intervale (spans) cu durata și, opțional, memoria maximă alocată
+              (tracemalloc) a fiecărei etape
+• move_rows – timpul mediu per mutare al fiecărei strategii, din dicționarul
+              `timings` completat de engine.stream_tournament / sandbox.run_sandboxed
+
+Etapele nu se imbrică; memoria e cea a procesului curent (fără workerii din pool).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import time
+import tracemalloc
+from typing import Dict, Iterator, List
+
+
+class Profiler:
+    """Colectează câte un rând {Etapă, Secunde, Memorie maximă (MiB)} per etapă."""
+
+    def __init__(self, memory: bool = False):
+        self.memory = memory  # tracemalloc încetinește vizibil codul Python
+        self.spans: List[Dict[str, object]] = []
+
+    @contextlib.contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        started_here = self.memory and not tracemalloc.is_tracing()
+        if started_here:
+            tracemalloc.start()
+        elif self.memory:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] if self.memory else None
+            if started_here:
+                tracemalloc.stop()
+            self.spans.append(
+                {
+                    "Etapă": stage,
+                    "Secunde": round(seconds, 3),
+                    "Memorie maximă (MiB)": None if peak is None else round(peak / 2**20, 2),
+                }
+            )
+
+    def rows(self) -> List[Dict[str, object]]:
+        total = sum(span["Secunde"] for span in self.spans) or 1.0
+        return [{**span, "Pondere": f"{span['Secunde'] / total:.0%}"} for span in self.spans]
+
+
+def move_rows(names: List[str], timings: Dict[int, List[float]]) -> List[Dict[str, object]]:
+    """Strategiile ordonate după timpul per mutare, cele mai lente primele."""
+    rows = [
+        {
+            "Strategie": names[i],
+            "µs/mutare": round(seconds / moves * 1e6, 1) if moves else None,
+            "Mutări": moves,
+            "Secunde în strategy()": round(seconds, 3),
+        }
+        for i, (seconds, moves) in timings.items()
+    ]
+    return sorted(rows, key=lambda row: -(row["µs/mutare"] or 0))
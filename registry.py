@@ -0,0 +1,133 @@
+"""
+Registrul strategiilor din strategies/:
+• StrategyRegistry – ține în memorie modulele compilate și clasele Player găsite,
+                     reimportă doar fișierele noi sau modificate
+• LoadRecord       – starea unui fișier: hash, timp de încărcare, clasa sau eroarea
+
+Fiecare fișier nou e compilat în __pycache__ (validation.precompile) și, dacă
+registrul are un `validate`, verificat într-un proces izolat înainte de a fi
+importat aici, deci codul de la nivel de modul nu poate bloca aplicația.
+
+Streamlit rulează din nou app.py la fiecare interacțiune, dar modulele importate
+rămân în memorie, deci un registru la nivel de modul (utils.REGISTRY) supraviețuiește
+între rerulări și sesiuni.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import inspect
+import pathlib
+import threading
+import time
+from typing import Callable, Dict, List, Type
+
+import axelrod as axl
+
+from validation import precompile
+
+
+# --------------------------------------------------------------------------- #
+class LoadRecord:
+    """Rezultatul încărcării unui fișier de strategie."""
+
+    def __init__(self, path: pathlib.Path, mtime_ns: int, content_hash: str):
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.content_hash = content_hash
+        self.player_class: Type[axl.Player] | None = None
+        self.error: str | None = None
+        self.load_seconds = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.player_class is not None
+
+    def as_row(self) -> Dict[str, object]:
+        return {
+            "Fișier": self.path.name,
+            "Clasă": self.player_class.__name__ if self.player_class else None,
+            "Încărcare (ms)": round(self.load_seconds * 1000, 2),
+            "Hash": self.content_hash[:12],
+            "Eroare": self.error,
+        }
+
+
+def _find_player_class(module) -> Type[axl.Player]:
+    """Prima subclasă a axelrod.Player găsită în modul."""
+    for obj in module.__dict__.values():
+        if inspect.isclass(obj) and issubclass(obj, axl.Player) and obj is not axl.Player:
+            return obj
+    raise ValueError("fișierul nu definește nicio subclasă a axelrod.Player")
+
+
+# --------------------------------------------------------------------------- #
+class StrategyRegistry:
+    """Cache pentru clasele Player din director, cheiat pe cale + mtime + hash.
+
+    `refresh()` face doar un `stat` pe fișierele neschimbate; un fișier cu mtime
+    nou dar același conținut nu se reimportă.
+    """
+
+    def __init__(
+        self,
+        directory: pathlib.Path,
+        on_load: Callable[[LoadRecord], None] | None = None,
+        validate: Callable[[str], None] | None = None,
+    ):
+        self.directory = directory
+        self.on_load = on_load  # apelat după fiecare (re)import, cu înregistrarea nouă
+        self.validate = validate  # (sursa), înainte de import; o excepție marchează fișierul ca invalid
+        self._records: Dict[pathlib.Path, LoadRecord] = {}
+        self._lock = threading.Lock()
+
+    def _load(self, path: pathlib.Path, mtime_ns: int, content_hash: str) -> LoadRecord:
+        record = LoadRecord(path, mtime_ns, content_hash)
+        start = time.perf_counter()
+        try:
+            if self.validate is not None:
+                self.validate(path.read_text(encoding="utf-8"))
+            precompile(path)  # importul de mai jos folosește bytecode-ul din __pycache__
+            spec = importlib.util.spec_from_file_location(path.stem, path)
+            if not (spec and spec.loader):
+                raise ImportError(f"nu pot încărca {path.name}")
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            cls = _find_player_class(module)
+            # hash-ul fișierului identifică strategia în rezultatele salvate (engine.PairStore)
+            cls._source_hash = record.content_hash
+            record.player_class = cls
+        except Exception as exc:
+            record.error = f"{type(exc).__name__}: {exc}"
+        record.load_seconds = time.perf_counter() - start
+        return record
+
+    def refresh(self) -> List[LoadRecord]:
+        """Sincronizează registrul cu directorul și întoarce toate înregistrările."""
+        with self._lock:
+            current = {}
+            for path in sorted(self.directory.glob("*.py")):
+                mtime_ns = path.stat().st_mtime_ns
+                record = self._records.get(path)
+                if record is None or record.mtime_ns != mtime_ns:
+                    content_hash = hashlib.sha256(path.read_bytes()).hexdigest()
+                    if record is not None and record.content_hash == content_hash:
+                        record.mtime_ns = mtime_ns
+                    else:
+                        record = self._load(path, mtime_ns, content_hash)
+                        if self.on_load is not None:
+                            self.on_load(record)
+                current[path] = record
+            self._records = current
+            return list(current.values())
+
+    @property
+    def records(self) -> List[LoadRecord]:
+        return list(self._records.values())
+
+    def player_classes(self) -> List[Type[axl.Player]]:
+        return [r.player_class for r in self.refresh() if r.ok]
+
+    def errors(self) -> Dict[str, str]:
+        return {r.path.name: r.error for r in self.records if r.error}
@@ -0,0 +1,193 @@
+"""
+Rulări de turneu partajate între sesiuni.
+
+Toți cei care deschid aplicația (de ex. din QR) și apasă „Rulează turneu”
+cu același set de strategii și aceiași parametri văd aceeași rulare:
+• RunManager – o singură rulare canonică per (hash-ul strategiilor, parametri);
+               o cerere nouă se atașează la rularea în curs sau primește
+               rezultatul deja calculat; cel mult `max_concurrent` rulări
+               folosesc procesoarele în același timp, restul așteaptă;
+               `slot()` pune în aceeași coadă și alte calcule grele (sweep, evoluție)
+• SharedRun  – starea unei rulări: progres, rezultat, eroare, id-ul din arhivă
+
+Rulările se fac pe thread-uri de fundal, deci continuă și dacă sesiunea care
+le-a pornit se închide; modulul (și RUNS) rămâne în memorie între rerulările
+Streamlit, ca generation.QUEUE.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+import axelrod as axl
+
+from engine import PairStore, Progress, player_key, stream_tournament
+
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = "în așteptare", "rulează", "gata", "eroare", "oprită"
+
+
+# --------------------------------------------------------------------------- #
+class SharedRun:
+    """O rulare canonică; sesiunile doar îi citesc starea."""
+
+    def __init__(self, key: str, players: List[axl.Player], options: Dict[str, object]):
+        self.key = key
+        self.players = players
+        self.options = options
+        self.status = QUEUED
+        self.progress: Progress | None = None
+        self.results = None
+        self.timings: Dict[int, List[float]] | None = {} if options.get("profile") else None
+        self.error: str | None = None
+        self.run_id: str | None = None  # id-ul din arhivă, dacă a fost salvată
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self.requests = 1  # câte cereri (sesiuni) au primit această rulare
+        self.cancel = threading.Event()
+        self._archive_lock = threading.Lock()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (DONE, FAILED, CANCELLED)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.finished:
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def archive(self, teams: Dict[str, str] | None = None) -> str:
+        """Salvează rezultatul în arhivă o singură dată, oricâte sesiuni cer asta."""
+        from archive import save_run
+
+        with self._archive_lock:
+            if self.run_id is None:
+                params = {k: v for k, v in self.options.items() if k in ("turns", "repetitions", "noise", "seed")}
+                self.run_id = save_run(self.results, self.options["turns"], self.options["game"], params, teams)
+            return self.run_id
+
+    def as_row(self) -> Dict[str, object]:
+        end = self.finished_at or time.time()
+        return {
+            "Rulare": self.key[:12],
+            "Stare": self.status,
+            "Jucători": len(self.players),
+            "Runde": self.options["turns"],
+            "Repetiții": self.options["repetitions"],
+            "Progres": f"{self.progress.fraction:.0%}" if self.progress else "-",
+            "Durată (s)": round(end - self.started_at, 1) if self.started_at else None,
+            "Eroare": self.error,
+        }
+
+    # ------------------------------------------------------------------ #
+    def _play(self) -> None:
+        o = self.options
+        params = dict(
+            turns=o["turns"], repetitions=o["repetitions"], game=o["game"],
+            noise=o["noise"], processes=o["processes"], seed=o["seed"],
+        )
+        if o["isolated"]:
+            from sandbox import run_sandboxed
+
+            self.results = run_sandboxed(self.players, budget=o["budget"], timings=self.timings, **params)
+            return
+        for progress in stream_tournament(
+            self.players, store=PairStore() if o["incremental"] else None, fast=o["fast"],
+            cancel=self.cancel, timings=self.timings, dedupe=o["dedupe"], **params,
+        ):
+            self.progress = progress
+        if self.cancel.is_set():
+            raise InterruptedError
+        self.results = self.progress.results
+
+
+class RunManager:
+    """Rulările canonice, cheiate pe strategii + parametri."""
+
+    def __init__(self, max_concurrent: int = 1, max_finished: int = 20):
+        self.max_finished = max_finished
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._runs: "OrderedDict[str, SharedRun]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(players: List[axl.Player], options: Dict[str, object]) -> str:
+        """Hash-ul setului de strategii (în ordine) și al parametrilor rulării."""
+        described = {k: v for k, v in options.items() if k not in ("game", "budget", "processes")}
+        described["game"] = list(options["game"].RPST())
+        budget = options.get("budget")
+        if options.get("isolated") and budget is not None:
+            described["budget"] = [budget.per_move, budget.per_match]
+        params = [[player_key(p) for p in players], described]
+        return hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+
+    def start(self, players: List[axl.Player], **options) -> SharedRun:
+        """Rularea pentru acești jucători și parametri: cea existentă sau una nouă.
+
+        Rulările eșuate sau oprite nu se refolosesc; o cerere nouă le repornește.
+        """
+        key = self.key(players, options)
+        with self._lock:
+            run = self._runs.get(key)
+            if run is not None and run.status not in (FAILED, CANCELLED):
+                self._runs.move_to_end(key)
+                run.requests += 1
+                return run
+            run = SharedRun(key, players, options)
+            self._runs[key] = run
+            self._forget_old()
+        threading.Thread(target=self._execute, args=(run,), name=f"run-{key[:8]}", daemon=True).start()
+        return run
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Ocupă unul din cele `max_concurrent` locuri (blochează până se eliberează unul).
+
+        Pentru calculele care pornesc propriul pool de procese în afara unei rulări
+        (pre-flight, sweep, matricea de plăți), ca încărcarea CPU să rămână limitată.
+        """
+        with self._slots:
+            yield
+
+    def _execute(self, run: SharedRun) -> None:
+        with self.slot():
+            if run.cancel.is_set():
+                run.status, run.finished_at = CANCELLED, time.time()
+                return
+            run.status, run.started_at = RUNNING, time.time()
+            try:
+                run._play()
+                run.status = DONE
+            except InterruptedError:
+                run.status = CANCELLED
+            except Exception as exc:
+                run.status, run.error = FAILED, f"{type(exc).__name__}: {exc}"
+            run.finished_at = time.time()
+
+    def _forget_old(self) -> None:
+        finished = [k for k, r in self._runs.items() if r.finished]
+        for key in finished[: max(0, len(finished) - self.max_finished)]:
+            del self._runs[key]
+
+    def cancel(self, key: str) -> None:
+        with self._lock:
+            run = self._runs.get(key)
+        if run is not None:
+            run.cancel.set()
+
+    def runs(self) -> List[SharedRun]:
+        """Toate rulările ținute în memorie, cele mai recente primele."""
+        with self._lock:
+            return list(reversed(self._runs.values()))
+
+
+# fiecare rulare are propriul pool de procese; două simultane ocupă deja toate nucleele
+RUNS = RunManager(max_concurrent=2)
@@ -0,0 +1,340 @@
+"""
+Execuție izolată a strategiilor generate:
+• Budget          – limitele de timp: per mutare și per meci (plus limită de CPU)
+• run_sandboxed   – turneu în care fiecare pereche rulează într-un proces separat;
+                    strategiile care depășesc bugetul sau aruncă excepții sunt
+                    descalificate, iar turneul continuă fără ele
+• preflight       – măsoară, tot izolat, timpul mediu (µs) per mutare al fiecărei strategii
+• smoke_test      – importul și meciul de pre-flight pentru codul unei strategii noi,
+                    ambele în procesul izolat (folosit la validare)
+
+Funcționează pe sisteme cu `fork` și SIGALRM (Linux, macOS).
+"""
+
+from __future__ import annotations
+
+import math
+import multiprocessing
+import os
+import signal
+import time
+from multiprocessing.connection import wait
+from typing import Callable, Dict, List, Tuple
+
+import axelrod as axl
+
+from engine import PairwiseResults, encode_interactions, pair_seed, player_key
+from utils import TRUST_GAME
+
+C, D = axl.Action.C, axl.Action.D
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# --------------------------------------------------------------------------- #
+class Budget:
+    """Limitele de timp (în secunde): `per_move` pentru un apel strategy(),
+    `per_match` pentru toate repetițiile unei perechi."""
+
+    def __init__(self, per_move: float = 0.05, per_match: float = 10.0):
+        self.per_move = per_move
+        self.per_match = per_match
+
+
+class MoveTimeout(BaseException):
+    """Ridicată de SIGALRM; nu e Exception, ca un `except Exception` din strategie să n-o înghită."""
+
+
+class StrategyFault(Exception):
+    """Strategia jucătorului `side` (0 sau 1) a depășit bugetul sau a aruncat o excepție."""
+
+    def __init__(self, side: int, reason: str):
+        super().__init__(reason)
+        self.side = side
+        self.reason = reason
+
+
+def _on_alarm(signum, frame):
+    raise MoveTimeout()
+
+
+class _Clock:
+    """Timpul cumulat în strategy() al fiecărei părți, în memorie partajată, ca
+    procesul părinte să știe pe cine să descalifice dacă oprește perechea."""
+
+    def __init__(self, ctx):
+        self.mover = ctx.Value("i", -1)  # partea care mută acum (-1 = niciuna)
+        self.started = ctx.Value("d", 0.0)  # time.monotonic() la începutul mutării în curs
+        self.spent = ctx.Array("d", 2)  # secunde cumulate în strategy(), per parte
+
+    def start(self, side: int) -> None:
+        self.started.value = time.monotonic()
+        self.mover.value = side
+
+    def stop(self, side: int) -> None:
+        self.spent[side] += time.monotonic() - self.started.value
+        self.mover.value = -1
+
+    def culprit(self) -> int:
+        """Partea cu mai mult timp în strategy(), inclusiv mutarea neterminată."""
+        totals = list(self.spent)
+        if self.mover.value in (0, 1):
+            totals[self.mover.value] += time.monotonic() - self.started.value
+        return 0 if totals[0] >= totals[1] else 1
+
+
+def _guard(player: axl.Player, side: int, budget: Budget, clock: _Clock, timings: List[float]) -> axl.Player:
+    """Înlocuiește `player.strategy` cu o variantă cronometrată și limitată în timp."""
+    original = player.strategy
+
+    def strategy(opponent):
+        clock.start(side)
+        signal.setitimer(signal.ITIMER_REAL, budget.per_move)
+        start = time.perf_counter()
+        try:
+            action = original(opponent)
+        except MoveTimeout:
+            raise StrategyFault(side, f"mutare mai lungă de {budget.per_move * 1000:.0f} ms")
+        except Exception as exc:
+            raise StrategyFault(side, f"{type(exc).__name__}: {exc}")
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            elapsed = time.perf_counter() - start
+            timings[side] += elapsed
+            clock.stop(side)
+        if elapsed > budget.per_move:  # alarma a fost prinsă de un `except:` din strategie
+            raise StrategyFault(side, f"mutare mai lungă de {budget.per_move * 1000:.0f} ms")
+        if action not in (C, D):
+            raise StrategyFault(side, f"mutare invalidă: {action!r} (trebuie C sau D)")
+        return action
+
+    player.strategy = strategy
+    return player
+
+
+def _play_guarded(player_a, player_b, turns, repetitions, game, noise, seed, budget, clock):
+    """Rulează în procesul copil: meciurile perechii, cu fiecare mutare cronometrată."""
+    signal.signal(signal.SIGALRM, _on_alarm)
+    timings = [0.0, 0.0]
+    moves = 0
+    out = []
+    for rep in range(repetitions):
+        pair = []
+        for side, player in enumerate((player_a, player_b)):
+            try:
+                pair.append(_guard(player.clone(), side, budget, clock, timings))
+            except Exception as exc:
+                raise StrategyFault(side, f"{type(exc).__name__}: {exc}")
+        match = axl.Match(
+            tuple(pair), turns=turns, game=game, noise=noise,
+            seed=None if seed is None else seed + rep,
+        )
+        interactions = match.play()
+        moves += len(interactions)
+        out.append(encode_interactions(interactions))
+    return out, [t / moves * 1e6 if moves else 0.0 for t in timings]
+
+
+def _load_and_play(code, class_name, turns, game, budget, clock):
+    """Rulează în procesul copil: importă codul (și codul de la nivel de modul),
+    instanțiază clasa și joacă un meci contra TitForTat."""
+    try:
+        namespace = {"__name__": f"strategy_{class_name}"}
+        exec(compile(code, f"<{class_name}>", "exec"), namespace)
+        player = namespace[class_name]()
+    except Exception as exc:
+        raise StrategyFault(0, f"eroare la încărcare: {type(exc).__name__}: {exc}")
+    return _play_guarded(player, axl.TitForTat(), turns, 1, game, 0, 0, budget, clock)
+
+
+# --------------------------------------------------------------------------- #
+def _child(conn, clock: _Clock, budget: Budget, fn: Callable, args: tuple) -> None:
+    if resource is not None:
+        cpu = math.ceil(budget.per_match) + 1
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu + 1))
+    try:
+        conn.send(("ok", fn(*args, budget, clock)))
+    except StrategyFault as fault:
+        conn.send(("fault", fault.side, fault.reason))
+    except Exception as exc:  # nu vine din strategy() (acolo devine StrategyFault): eroare internă
+        conn.send(("fault", -1, f"{type(exc).__name__}: {exc}"))
+    finally:
+        conn.close()
+
+
+def _run_jobs(
+    jobs: Dict[object, tuple],
+    budget: Budget,
+    processes: int | None,
+    skip: Callable[[object], bool] = lambda key: False,
+    on_result: Callable[[object, tuple], None] = lambda key, outcome: None,
+    fn: Callable = _play_guarded,
+) -> None:
+    """Rulează fiecare job (fn, args) într-un proces propriu, cel mult
+    `processes` în paralel, și omoară procesele care depășesc `budget.per_match`.
+    Pentru o pereche oprită (timp sau CPU) e vinovată partea cu mai mult timp
+    cumulat în strategy(), nu cea care muta întâmplător în acel moment."""
+    ctx = multiprocessing.get_context("fork")
+    if processes == 0:
+        processes = os.cpu_count() or 1
+    processes = processes or 1
+    pending = list(jobs)
+    running: Dict[object, tuple] = {}
+
+    while pending or running:
+        while pending and len(running) < processes:
+            key = pending.pop(0)
+            if skip(key):
+                continue
+            reader, writer = ctx.Pipe(duplex=False)
+            clock = _Clock(ctx)
+            proc = ctx.Process(target=_child, args=(writer, clock, budget, fn, jobs[key]), daemon=True)
+            proc.start()
+            writer.close()
+            running[reader] = (key, proc, clock, time.monotonic() + budget.per_match)
+        if not running:
+            continue
+
+        timeout = max(0.0, min(entry[3] for entry in running.values()) - time.monotonic())
+        for reader in wait(list(running), timeout=timeout):
+            key, proc, clock, _ = running.pop(reader)
+            try:
+                outcome = reader.recv()
+            except EOFError:  # proces oprit de limita de CPU sau căzut
+                outcome = ("fault", clock.culprit(), "procesul strategiei a fost oprit (CPU)")
+            proc.join()
+            on_result(key, outcome)
+
+        now = time.monotonic()
+        for reader, (key, proc, clock, deadline) in list(running.items()):
+            if now >= deadline:
+                culprit = clock.culprit()
+                proc.kill()
+                proc.join()
+                del running[reader]
+                on_result(key, ("fault", culprit, f"meci mai lung de {budget.per_match:.0f} s"))
+
+
+# --------------------------------------------------------------------------- #
+def run_sandboxed(
+    players: List[axl.Player],
+    turns: int = 200,
+    repetitions: int = 5,
+    game: axl.Game | None = None,
+    noise: float = 0,
+    seed: int | None = None,
+    processes: int | None = None,
+    budget: Budget | None = None,
+    timings: Dict[int, List[float]] | None = None,
+) -> PairwiseResults:
+    """Turneu round-robin cu fiecare pereche într-un proces separat.
+
+    O strategie care depășește bugetul sau aruncă o excepție e descalificată:
+    nu mai joacă alte meciuri și lipsește din clasament. Rezultatul are
+    atributul suplimentar `disqualified` = {nume strategie: motiv}; perechile
+    căzute dintr-o eroare care nu ține de vreo strategie nu descalifică pe nimeni,
+    lipsesc din rezultate și apar în `errors` = {"A vs B": motiv}.
+    `timings` primește, ca la engine.stream_tournament, {indice: [secunde, mutări]}.
+    """
+    game = game or TRUST_GAME
+    budget = budget or Budget()
+    keys = [player_key(p) for p in players]
+    jobs = {
+        (i, j): (players[i], players[j], turns, repetitions, game, noise, pair_seed(seed, keys[i], keys[j]))
+        for i in range(len(players))
+        for j in range(i + 1, len(players))
+    }
+
+    disqualified: Dict[int, str] = {}
+    errors: Dict[Tuple[int, int], str] = {}
+    played: Dict[Tuple[int, int], List[str]] = {}
+
+    def on_result(pair, outcome):
+        if outcome[0] == "ok":
+            played[pair] = outcome[1][0]
+            if timings is not None:
+                moves = sum(len(e) for e in played[pair])
+                for side in (0, 1):
+                    entry = timings.setdefault(pair[side], [0.0, 0])
+                    entry[0] += outcome[1][1][side] * moves / 1e6
+                    entry[1] += moves
+        else:
+            _, side, reason = outcome
+            if side in (0, 1):
+                disqualified.setdefault(pair[side], reason)
+            else:
+                errors[pair] = reason
+
+    _run_jobs(
+        jobs, budget, processes,
+        skip=lambda pair: pair[0] in disqualified or pair[1] in disqualified,
+        on_result=on_result,
+    )
+
+    remaining = [i for i in range(len(players)) if i not in disqualified]
+    index = {old: new for new, old in enumerate(remaining)}
+    interactions = {
+        (index[i], index[j]): reps
+        for (i, j), reps in played.items()
+        if i in index and j in index
+    }
+    results = PairwiseResults([str(players[i]) for i in remaining], interactions, repetitions, game)
+    results.disqualified = {str(players[i]): reason for i, reason in disqualified.items()}
+    results.errors = {f"{players[i]} vs {players[j]}": reason for (i, j), reason in errors.items()}
+    return results
+
+
+def preflight(
+    players: List[axl.Player],
+    turns: int = 100,
+    game: axl.Game | None = None,
+    processes: int | None = None,
+    budget: Budget | None = None,
+) -> List[Dict[str, object]]:
+    """Un meci scurt, izolat, contra TitForTat pentru fiecare strategie.
+
+    Întoarce câte un rând {Strategie, µs/mutare, Status}, ca strategiile lente
+    sau defecte să fie vizibile înainte de turneul propriu-zis.
+    """
+    game = game or TRUST_GAME
+    budget = budget or Budget()
+    jobs = {i: (player, axl.TitForTat(), turns, 1, game, 0, 0) for i, player in enumerate(players)}
+    rows: Dict[int, Dict[str, object]] = {}
+
+    def on_result(i, outcome):
+        if outcome[0] == "ok":
+            rows[i] = {"Strategie": str(players[i]), "µs/mutare": round(outcome[1][1][0], 1), "Status": "ok"}
+        else:
+            side, reason = outcome[1], outcome[2]
+            status = reason if side == 0 else f"adversarul: {reason}" if side == 1 else f"eroare internă: {reason}"
+            rows[i] = {"Strategie": str(players[i]), "µs/mutare": None, "Status": status}
+
+    _run_jobs(jobs, budget, processes, on_result=on_result)
+    return sorted(rows.values(), key=lambda row: -(row["µs/mutare"] or math.inf))
+
+
+def smoke_test(
+    code: str,
+    class_name: str,
+    turns: int = 20,
+    game: axl.Game | None = None,
+    budget: Budget | None = None,
+) -> str | None:
+    """Importă codul și joacă meciul de pre-flight, totul în procesul izolat și în
+    limitele `budget` (un `while True` la nivel de modul e oprit după `per_match`).
+    None dacă a mers, altfel motivul."""
+    game = game or TRUST_GAME
+    budget = budget or Budget()
+    outcome = []
+    _run_jobs(
+        {0: (code, class_name, turns, game)}, budget, 1,
+        on_result=lambda key, result: outcome.append(result), fn=_load_and_play,
+    )
+    result = outcome[0]
+    if result[0] == "ok":
+        return None
+    side, reason = result[1], result[2]
+    return reason if side == 0 else f"adversarul: {reason}" if side == 1 else f"eroare internă: {reason}"
@@ -0,0 +1,71 @@
+"""
+Clasamentele din tab-ul „Turneu”, calculate o singură dată:
+• standings_frame – un DataFrame cu un rând per strategie și toate coloanele
+                    (rank, echipă, scor median, puncte, cooperare, CC/CT/TC/TT)
+• total_view / median_view / cooperation_view – clasamentele afișate, ca
+                    simple selecții și sortări din acel DataFrame
+
+Funcționează cu orice obiect cu interfața axelrod.Result (inclusiv
+engine.PairwiseResults): summarise() se apelează o singură dată.
+"""
+
+from __future__ import annotations
+
+from typing import Dict
+
+import pandas as pd
+
+
+def _team_key(name: str) -> str:
+    return name.strip().lower().replace(" ", "")
+
+
+def standings_frame(results, teams: Dict[str, str] | None = None) -> pd.DataFrame:
+    """Un rând per strategie, în ordinea clasamentului după scorul median.
+
+    Rândurile din summarise() sunt deja ordonate după rank, iar
+    `results.ranking[rank]` dă indicele jucătorului, deci scorurile și
+    ratingul de cooperare (indexate după jucător) se aliniază corect.
+    """
+    teams = teams or {}
+    summary = results.summarise()
+    index = list(results.ranking)
+    return pd.DataFrame(
+        {
+            "Rank": [row.Rank + 1 for row in summary],
+            "Echipa": [teams.get(_team_key(row.Name)) for row in summary],
+            "Strategie": [row.Name for row in summary],
+            "Scor median": [row.Median_score for row in summary],
+            "Puncte": [sum(results.scores[i]) for i in index],
+            "Scoruri": [list(results.scores[i]) for i in index],
+            "Cooperare": [results.cooperating_rating[i] for i in index],
+            "Victorii": [row.Wins for row in summary],
+            "CC": [row.CC_rate for row in summary],
+            "CT": [row.CD_rate for row in summary],
+            "TC": [row.DC_rate for row in summary],
+            "TT": [row.DD_rate for row in summary],
+        }
+    )
+
+
+# --------------------------------------------------------------------------- #
+def total_view(frame: pd.DataFrame) -> pd.DataFrame:
+    """Clasamentul după punctajul total."""
+    view = frame[["Echipa", "Strategie", "Puncte"]].sort_values("Puncte", ascending=False, kind="stable")
+    return view.round(2).reset_index(drop=True)
+
+
+def median_view(frame: pd.DataFrame) -> pd.DataFrame:
+    """Clasamentul după scorul median, cu ratele stărilor în procente."""
+    view = frame[["Rank", "Echipa", "Strategie", "Scor median", "Puncte", "CC", "CT", "TC", "TT"]].round(2)
+    for column in ("CC", "CT", "TC", "TT"):
+        view[column] = frame[column].map("{:.0%}".format)
+    return view
+
+
+def cooperation_view(frame: pd.DataFrame) -> pd.DataFrame:
+    """Ratingul de cooperare și scorurile pe repetiții, după punctajul total."""
+    view = frame[["Rank", "Strategie", "Cooperare", "Scoruri", "Puncte"]].sort_values(
+        "Puncte", ascending=False, kind="stable"
+    )
+    return view.round(2).reset_index(drop=True)
@@ -0,0 +1,117 @@
+"""
+Sweep de parametri: același set de strategii, jucat pe o grilă de
+zgomot × runde × repetiții × plăți (R, S, T, P).
+
+• grid        – celulele grilei (produsul cartezian al listelor)
+• iter_sweep  – joacă celulele una câte una, fiecare pe pool-ul de procese al
+                motorului, și produce un tabel „tidy” (un rând per strategie)
+                după fiecare celulă
+• run_sweep   – consumă iter_sweep și întoarce tabelul complet
+• rank_matrix – rangul fiecărei strategii în fiecare celulă (pentru heatmap)
+• stability   – cât de mult variază rangul unei strategii pe toată grila
+
+Perechile se salvează în PairStore cu cheia (runde, zgomot, seed), deci și
+celulele care diferă doar prin plăți sau prin numărul de repetiții refolosesc
+meciurile: mutările se punctează din nou sub fiecare joc (cu excepția strategiilor
+care folosesc jocul), iar perechile deterministe se joacă o singură dată.
+"""
+
+from __future__ import annotations
+
+import itertools
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+import axelrod as axl
+import pandas as pd
+
+from engine import PairStore, stream_tournament
+from standings import standings_frame
+from utils import TRUST_GAME
+
+Payoffs = Tuple[float, float, float, float]  # (R, S, T, P)
+
+CELL_COLUMNS = ["Zgomot", "Runde", "Repetiții", "R", "S", "T", "P"]
+RESULT_COLUMNS = ["Rank", "Echipa", "Strategie", "Scor median", "Puncte", "Cooperare"]
+
+
+def grid(
+    noises: Sequence[float] = (0,),
+    turns: Sequence[int] = (200,),
+    repetitions: Sequence[int] = (5,),
+    payoffs: Sequence[Payoffs] | None = None,
+) -> List[Dict[str, float]]:
+    """Celulele grilei, ca dicționare cu cheile din CELL_COLUMNS."""
+    if payoffs is None:
+        R, P, S, T = TRUST_GAME.RPST()
+        payoffs = [(R, S, T, P)]
+    return [
+        {"Zgomot": noise, "Runde": t, "Repetiții": r, "R": R, "S": S, "T": T, "P": P}
+        for noise, t, r, (R, S, T, P) in itertools.product(noises, turns, repetitions, payoffs)
+    ]
+
+
+def cell_label(cell: Dict[str, float]) -> str:
+    return (
+        f"z={cell['Zgomot']:g} · {cell['Runde']}r · {cell['Repetiții']}x · "
+        f"({cell['R']:g},{cell['S']:g},{cell['T']:g},{cell['P']:g})"
+    )
+
+
+# --------------------------------------------------------------------------- #
+def iter_sweep(
+    players: List[axl.Player],
+    cells: List[Dict[str, float]],
+    seed: int | None = None,
+    processes: int | None = None,
+    store: PairStore | None = None,
+    fast: bool = True,
+    teams: Dict[str, str] | None = None,
+) -> Iterator[pd.DataFrame]:
+    """După fiecare celulă, rândurile ei: parametrii celulei + clasamentul."""
+    for cell in cells:
+        game = axl.Game(r=cell["R"], s=cell["S"], t=cell["T"], p=cell["P"])
+        progress = None
+        for progress in stream_tournament(
+            players, int(cell["Runde"]), int(cell["Repetiții"]), game,
+            cell["Zgomot"], seed, processes, store, fast,
+        ):
+            pass
+        frame = standings_frame(progress.results, teams)[RESULT_COLUMNS]
+        params = {"Celulă": cell_label(cell), **{column: cell[column] for column in CELL_COLUMNS}}
+        yield frame.assign(**params)[list(params) + RESULT_COLUMNS]
+
+
+def run_sweep(
+    players: List[axl.Player],
+    cells: List[Dict[str, float]],
+    seed: int | None = None,
+    processes: int | None = None,
+    store: PairStore | None = None,
+    fast: bool = True,
+    teams: Dict[str, str] | None = None,
+) -> pd.DataFrame:
+    """Tabelul tidy al întregii grile (un rând per celulă × strategie)."""
+    parts = list(iter_sweep(players, cells, seed, processes, store or PairStore(), fast, teams))
+    return pd.concat(parts, ignore_index=True)
+
+
+# --------------------------------------------------------------------------- #
+def rank_matrix(table: pd.DataFrame) -> pd.DataFrame:
+    """Strategii × celule, valori = rangul; rândurile în ordinea rangului mediu."""
+    matrix = table.pivot_table(index="Strategie", columns="Celulă", values="Rank", aggfunc="mean")
+    matrix = matrix[list(dict.fromkeys(table["Celulă"]))]  # ordinea din grilă
+    return matrix.loc[matrix.mean(axis=1).sort_values(kind="stable").index]
+
+
+def stability(table: pd.DataFrame) -> pd.DataFrame:
+    """Rangul mediu, abaterea standard și intervalul rangurilor pe grilă."""
+    ranks = table.groupby("Strategie")["Rank"]
+    out = pd.DataFrame(
+        {
+            "Rank mediu": ranks.mean(),
+            "Abatere": ranks.std(ddof=0),
+            "Cel mai bun": ranks.min(),
+            "Cel mai slab": ranks.max(),
+        }
+    )
+    return out.sort_values("Rank mediu", kind="stable").round(2).reset_index()
@@ -1,43 +1,47 @@
 """
 Funcții helper pentru arena Prisoner's Dilemma:
 • nl_to_player  – convertește o descriere natural-language într-o clasă axelrod.Player
-• load_players  – încarcă toate strategiile (.py) din folderul strategies/
-• run_tournament – pornește un turneu Axelrod și returnează obiectul Results
+• load_players  – încarcă toate strategiile (.py) din folderul strategies/ (cu cache)
+• run_tournament – rulează un turneu cu motorul din engine.py și returnează clasamentul
+                   (opțional în paralel, pe mai multe procese)
 """
 
 from __future__ import annotations
 
-import inspect
-import importlib.util
+import hashlib
 import os
-import json
 import pathlib
 import textwrap
+import threading
 from typing import Dict, List
 
 import axelrod as axl
-import openai
-import google.generativeai as genai
 
-# ---- inițializăm clientul OpenAI (API key trebuie să fie în variabila de mediu) ----
-client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+from llm_cache import CodeCache
+from metastore import MetaStore
+from registry import StrategyRegistry
+from validation import ValidationError, check_source, strip_fences, validate, validate_source
 
 # directorul în care salvăm strategiile generate
 STRATEGY_DIR = pathlib.Path(__file__).parent / "strategies"
 STRATEGY_DIR.mkdir(exist_ok=True)
-META_FILE = STRATEGY_DIR / "meta.json"  # salvează {strategie: echipă}
+META_FILE = STRATEGY_DIR / "meta.json"  # vechea mapare {strategie: echipă}, importată în META
+META = MetaStore(STRATEGY_DIR / "meta.db", legacy_json=META_FILE)  # echipă, hash, backend, validare
 
-# --------------------------------------------------------------------------- #
-def _load_meta() -> Dict[str, str]:
-    if META_FILE.exists():
-        return json.loads(META_FILE.read_text())
-    return {}
+
+def _record_validation(record) -> None:
+    META.upsert(
+        record.path.stem,
+        file_hash=record.content_hash,
+        status="valid" if record.ok else f"invalid: {record.error}",
+    )
 
 
-def _save_meta(meta: Dict[str, str]) -> None:
-    META_FILE.write_text(json.dumps(meta, indent=2))
+# clasele Player încărcate; în turneu ajung doar cele care trec de validare
+REGISTRY = StrategyRegistry(STRATEGY_DIR, on_load=_record_validation, validate=validate_source)
 
+# jocul folosit în arenă: R=2, S=-1, T=3, P=0 (vezi infograficul din tab-ul de reguli)
+TRUST_GAME = axl.Game(r=2, s=-1, t=3, p=0)
 
 
 SYSTEM_PROMPT = (
@@ -109,82 +113,167 @@ Here are the precise requirements and guidelines for creating an `axelrod.Player
 
 
 # --------------------------------------------------------------------------- #
-def gepeto_to_player(name: str, description: str, team: str) -> pathlib.Path:
-    """Generează fișierul utils/strategies/<name>.py ce conține clasa cerută."""
-    if not name.isidentifier():
-        raise ValueError("«Numele strategiei» trebuie să fie un identificator Python valid.")
-    prompt = (
-        f"Scrie o clasă Python numită {name} care extinde axelrod.Player și "
-        f"implementează strategia:\n\"\"\"\n{description}\n\"\"\""
-    )
-
-    response = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": prompt},
-        ],
-        temperature=0.2,
-    )
-
-    code = textwrap.dedent(response.choices[0].message.content)
-    file_path = STRATEGY_DIR / f"{name}.py"
-    file_path.write_text(code, encoding="utf-8")
+OPENAI_MODEL = "gpt-4o-mini"
+GEMINI_MODEL = "gemini-2.5-flash-preview-05-20"
+# se schimbă automat când edităm prompt-urile, deci invalidează cache-ul de cod
+PROMPT_VERSION = hashlib.sha256((SYSTEM_PROMPT + PROMPT_AXELROD_PLAYER).encode()).hexdigest()[:12]
+
+
+class LLMClient:
+    """Client comun pentru ambele backend-uri ("openai" și "gemini").
+
+    Clienții SDK se creează o singură dată, la prima cerere, și sunt folosiți
+    din toate sesiunile și thread-urile. Cheile API vin din variabilele de mediu
+    OPENAI_API_KEY / GEMINI_API_KEY; OPENAI_BASE_URL poate indica un server local
+    compatibil OpenAI (de ex. un model stub pentru teste).
+    """
+
+    BACKENDS = ("openai", "gemini")
+
+    def __init__(
+        self,
+        openai_model: str = OPENAI_MODEL,
+        gemini_model: str = GEMINI_MODEL,
+        cache: CodeCache | None = None,
+        max_attempts: int = 3,
+    ):
+        self.openai_model = openai_model
+        self.gemini_model = gemini_model
+        self.cache = cache
+        self.max_attempts = max_attempts  # cereri către model până la un cod valid
+        self._lock = threading.Lock()
+        self._openai = None
+        self._gemini = None
+
+    def _openai_client(self):
+        with self._lock:
+            if self._openai is None:
+                import openai  # SDK-urile se importă doar la prima cerere, ca `import utils` să fie rapid
+
+                self._openai = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+            return self._openai
+
+    def _gemini_client(self):
+        with self._lock:
+            if self._gemini is None:
+                import google.generativeai as genai
+
+                genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+                self._gemini = genai.GenerativeModel(self.gemini_model)
+            return self._gemini
+
+    def model_name(self, backend: str) -> str:
+        if backend == "openai":
+            return self.openai_model
+        if backend == "gemini":
+            return self.gemini_model
+        raise ValueError(f"Backend necunoscut: {backend!r} (alege dintre {', '.join(self.BACKENDS)})")
+
+    def generate(self, backend: str, name: str, description: str) -> str:
+        """Codul Python generat de model (sau luat din cache) pentru strategia `name`.
+
+        Codul trece prin validation.validate; dacă e respins, modelul primește
+        eroarea și codul său și e rugat să-l corecteze (de cel mult `max_attempts` ori).
+        În cache ajunge doar cod validat.
+        """
+        key = CodeCache.key(backend, self.model_name(backend), PROMPT_VERSION, description, name)
+        if self.cache is not None:
+            code = self.cache.get(key)
+            if code is not None:
+                return code
+        feedback = None
+        for _ in range(self.max_attempts):
+            code = strip_fences(self._call_model(backend, name, description, feedback))
+            try:
+                validate(code, name)
+            except ValidationError as exc:
+                feedback = (code, str(exc))
+                continue
+            if self.cache is not None:
+                self.cache.put(key, code)
+            return code
+        raise ValidationError(f"codul generat nu e valid după {self.max_attempts} încercări: {feedback[1]}")
+
+    def _call_model(self, backend: str, name: str, description: str, feedback: tuple | None = None) -> str:
+        prompt = (
+            f"Scrie o clasă Python numită {name} care extinde axelrod.Player și "
+            f"implementează strategia:\n\"\"\"\n{description}\n\"\"\""
+        )
+        if feedback is not None:
+            previous, error = feedback
+            prompt += (
+                f"\n\nVersiunea anterioară a codului a fost respinsă.\nEroare: {error}\n"
+                f"Cod:\n{previous}\nTrimite din nou întreaga clasă, corectată."
+            )
+        if backend == "openai":
+            response = self._openai_client().chat.completions.create(
+                model=self.openai_model,
+                messages=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt},
+                ],
+                temperature=0.2,
+            )
+            return textwrap.dedent(response.choices[0].message.content)
+        if backend == "gemini":
+            response = self._gemini_client().generate_content(PROMPT_AXELROD_PLAYER + " " + prompt)
+            return textwrap.dedent(response.text)
+        raise ValueError(f"Backend necunoscut: {backend!r} (alege dintre {', '.join(self.BACKENDS)})")
 
-    # --- actualizează maparea strategie → echipă ---------------------------
-    meta = _load_meta()
-    meta[name.strip().lower()] = team.strip().lower()
-    _save_meta(meta)
 
-    return file_path
+LLM = LLMClient(cache=CodeCache(STRATEGY_DIR / ".llm_cache"))
 
 
-# --------------------------------------------------------------------------- #
-def gemini_to_player(name: str, description: str, team: str) -> pathlib.Path:
-    """Generează fișierul utils/strategies/<name>.py ce conține clasa cerută."""
+def check_strategy_name(name: str) -> None:
     if not name.isidentifier():
         raise ValueError("«Numele strategiei» trebuie să fie un identificator Python valid. Scrie fără spații")
-    prompt = (
-        f"Scrie o clasă Python numită {name} care extinde axelrod.Player și "
-        f"implementează strategia:\n\"\"\"\n{description}\n\"\"\""
-    )
-
-    MODEL_NAME = "gemini-2.5-flash-preview-05-20" # This usually points to the latest stable Pro version
 
-    model = genai.GenerativeModel(MODEL_NAME)
 
-    response = model.generate_content(PROMPT_AXELROD_PLAYER + " " + prompt)
+def save_strategy(name: str, code: str, team: str, backend: str | None = None) -> pathlib.Path:
+    """Scrie strategies/<name>.py și actualizează maparea strategie → echipă.
 
-    code = textwrap.dedent(response.text)
+    Codul fără clasa `name` (subclasă axl.Player cu name, classifier și strategy)
+    nu se salvează: ValidationError. Meciul de test îl face REGISTRY la import.
+    """
+    code = strip_fences(code)
+    check_source(code, name)
     file_path = STRATEGY_DIR / f"{name}.py"
     file_path.write_text(code, encoding="utf-8")
 
-    # --- actualizează maparea strategie → echipă ---------------------------
-    meta = _load_meta()
-    meta[name.strip().lower()] = team.strip().lower()
-    _save_meta(meta)
+    # --- actualizează maparea strategie → echipă (o singură scriere atomică) ---
+    META.upsert(
+        name,
+        team=team.strip().lower(),
+        file_hash=hashlib.sha256(code.encode("utf-8")).hexdigest(),
+        backend=backend,
+    )
+    REGISTRY.refresh()  # importă fișierul nou și înregistrează starea validării în META
 
     return file_path
 
 
+# --------------------------------------------------------------------------- #
+def gepeto_to_player(name: str, description: str, team: str) -> pathlib.Path:
+    """Generează fișierul utils/strategies/<name>.py ce conține clasa cerută."""
+    check_strategy_name(name)
+    return save_strategy(name, LLM.generate("openai", name, description), team, backend="openai")
+
+
+# --------------------------------------------------------------------------- #
+def gemini_to_player(name: str, description: str, team: str) -> pathlib.Path:
+    """Generează fișierul utils/strategies/<name>.py ce conține clasa cerută."""
+    check_strategy_name(name)
+    return save_strategy(name, LLM.generate("gemini", name, description), team, backend="gemini")
+
+
 # --------------------------------------------------------------------------- #
 def load_players(extra_players: List[axl.Player] | None = None) -> List[axl.Player]:
-    """Importă toate fișierele .py din STRATEGY_DIR și returnează instanțe Player."""
-    players: List[axl.Player] = []
-    for path in STRATEGY_DIR.glob("*.py"):
-        spec = importlib.util.spec_from_file_location(path.stem, path)
-        if spec and spec.loader:
-            mod = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(mod)
-            # prima subclasă a axelrod.Player gasită în modul
-            cls = next(
-                c
-                for c in mod.__dict__.values()
-                if inspect.isclass(c)
-                and issubclass(c, axl.Player)
-                and c is not axl.Player
-            )
-            players.append(cls())
+    """Returnează câte o instanță Player pentru fiecare fișier .py valid din STRATEGY_DIR.
+
+    Fișierele neschimbate de la ultima încărcare nu se mai importă (vezi REGISTRY);
+    fișierele cu erori sunt sărite și apar în `REGISTRY.errors()`.
+    """
+    players: List[axl.Player] = [cls() for cls in REGISTRY.player_classes()]
 
     if extra_players:
         players.extend(extra_players)
@@ -196,12 +285,32 @@ def run_tournament(
     players: List[axl.Player],
     turns: int = 200,
     repetitions: int = 5,
-) -> axl.Result:
-    """Rulează turneul și întoarce obiectul Results (axelrod.Result)."""
-    tournament = axl.Tournament(players=players, turns=turns, repetitions=repetitions)
-    return tournament.play()
+    game: axl.Game | None = None,
+    noise: float = 0,
+    processes: int | None = None,
+    seed: int | None = None,
+    store=None,
+    fast: bool = False,
+):
+    """Rulează turneul până la capăt și întoarce clasamentul final
+    (engine.PairwiseResults, cu aceeași interfață ca axelrod.Result).
+
+    Folosește același motor ca tab-ul Turneu (engine.stream_tournament).
+    `processes` – numărul de procese worker: None/1 = serial, 0 = toate nucleele;
+    cu același `seed` rezultatele sunt identice cu cele ale rulării seriale.
+    Vezi stream_tournament pentru `store` (turneu incremental) și `fast`.
+    """
+    from engine import stream_tournament  # engine importă utils
+
+    progress = None
+    for progress in stream_tournament(
+        players, turns, repetitions, game, noise, seed, processes, store, fast
+    ):
+        pass
+    return progress.results
+
 
 # --------------------------------------------------------------------------- #
 def get_team_mapping() -> Dict[str, str]:
     """Returnează dict {strategie: echipă}."""
-    return _load_meta()
\ No newline at end of file
+    return META.team_mapping()
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""
+Validarea codului generat, înainte ca o strategie să ajungă în turneu:
+• strip_fences – scoate blocurile ``` și textul din jurul lor din răspunsul modelului
+• check_source – verificare statică (ast): o subclasă axl.Player cu `name`,
+                 `classifier` și `strategy(self, opponent)`
+• precompile   – compilează fișierul în __pycache__ (.pyc verificat prin hash),
+                 bytecode-ul pe care îl folosește apoi importul din registry
+• validate     – verificarea statică + importul și un meci scurt contra TitForTat,
+                 izolate și limitate în timp (sandbox.smoke_test)
+
+O eroare de validare e un ValidationError (ValueError), cu un mesaj pe care
+LLMClient îl trimite înapoi modelului când cere o versiune corectată.
+"""
+
+from __future__ import annotations
+
+import ast
+import pathlib
+import py_compile
+import re
+import textwrap
+
+_FENCE = re.compile(r"```[ \t]*[\w+-]*[ \t]*\n(.*?)(?:```|\Z)", re.DOTALL)
+
+
+class ValidationError(ValueError):
+    pass
+
+
+def strip_fences(text: str) -> str:
+    """Conținutul primului bloc ``` (dacă există), fără indentarea comună."""
+    match = _FENCE.search(text)
+    if match:
+        text = match.group(1)
+    return textwrap.dedent(text).strip() + "\n"
+
+
+def _is_player_base(base: ast.expr) -> bool:
+    # axl.Player, axelrod.Player sau Player (importat direct)
+    if isinstance(base, ast.Attribute):
+        return base.attr == "Player"
+    return isinstance(base, ast.Name) and base.id == "Player"
+
+
+def check_source(code: str, name: str | None = None) -> str:
+    """Verificarea statică; întoarce numele clasei găsite.
+
+    Cu `name`, clasa trebuie să se numească exact așa (ca fișierul strategies/<name>.py).
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError as exc:
+        raise ValidationError(f"cod Python invalid (linia {exc.lineno}): {exc.msg}") from None
+
+    classes = [
+        node for node in tree.body
+        if isinstance(node, ast.ClassDef) and any(_is_player_base(b) for b in node.bases)
+    ]
+    if name is not None:
+        classes = [node for node in classes if node.name == name]
+    if not classes:
+        wanted = f"clasa {name}" if name else "o clasă"
+        raise ValidationError(f"lipsește {wanted} care extinde axl.Player")
+    cls = classes[0]
+
+    attributes = {
+        target.id
+        for node in cls.body if isinstance(node, (ast.Assign, ast.AnnAssign))
+        for target in (node.targets if isinstance(node, ast.Assign) else [node.target])
+        if isinstance(target, ast.Name)
+    }
+    for attribute in ("name", "classifier"):
+        if attribute not in attributes:
+            raise ValidationError(f"clasa {cls.name} nu definește atributul `{attribute}`")
+
+    methods = {node.name: node for node in cls.body if isinstance(node, ast.FunctionDef)}
+    strategy = methods.get("strategy")
+    if strategy is None:
+        raise ValidationError(f"clasa {cls.name} nu definește metoda `strategy(self, opponent)`")
+    if len(strategy.args.args) != 2:
+        raise ValidationError("metoda `strategy` trebuie să aibă exact semnătura `strategy(self, opponent)`")
+    return cls.name
+
+
+def precompile(path: pathlib.Path) -> pathlib.Path:
+    """Scrie bytecode-ul fișierului; importul îl refolosește cât timp hash-ul sursei e același."""
+    return pathlib.Path(
+        py_compile.compile(
+            str(path), doraise=True, invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH
+        )
+    )
+
+
+def smoke_check(code: str, class_name: str, turns: int = 20, budget=None) -> None:
+    """Importul codului și un meci scurt contra TitForTat, într-un proces separat
+    și limitat în timp (vezi sandbox.smoke_test). Codul nu rulează în procesul
+    aplicației înainte să treacă de aici."""
+    from sandbox import Budget, smoke_test
+
+    error = smoke_test(code, class_name, turns=turns, budget=budget or Budget(per_move=0.05, per_match=5.0))
+    if error is not None:
+        raise ValidationError(f"meciul de test contra TitForTat a eșuat: {error}")
+
+
+def validate(code: str, name: str | None = None, turns: int = 20) -> str:
+    """Toate verificările, pe cod care nu e încă salvat; întoarce numele clasei."""
+    class_name = check_source(code, name)
+    smoke_check(code, class_name, turns=turns)
+    return class_name
+
+
+def validate_source(source: str) -> None:
+    """Aceleași verificări pentru un fișier din strategies/, înainte de import
+    (hook-ul din StrategyRegistry)."""
+    smoke_check(source, check_source(source))
@@ -0,0 +1,181 @@
+"""
+Motor rapid (NumPy) pentru strategiile deterministe cu memorie mică.
+
+Un jucător determinist cu `classifier['memory_depth'] = d` alege mutarea doar
+în funcție de ultimele d runde, deci comportamentul lui e un tabel
+stare → mutare, unde starea e istoricul comun al ultimelor d runde.
+
+• transition_table – sondează o singură dată jucătorul și construiește tabelul
+• FastEngine       – joacă toate perechile eligibile simultan, pas cu pas, în NumPy
+
+Jucătorii stocastici, cei cu memorie infinită sau cei al căror comportament
+nu corespunde clasificatorului declarat nu sunt eligibili și se joacă
+normal, cu axl.Match (vezi engine.run_incremental).
+"""
+
+from __future__ import annotations
+
+import numbers
+from typing import Dict, List, Sequence, Tuple
+
+import axelrod as axl
+import numpy as np
+
+C, D = axl.Action.C, axl.Action.D
+
+MAX_MEMORY_DEPTH = 3  # 1 + 4 + 16 + 64 = 85 de stări per jucător
+
+# adversari folosiți pentru a verifica tabelul față de meciuri reale, de lungimea turneului
+_PROBE_OPPONENTS = (axl.Cooperator, axl.Defector, axl.Alternator, axl.TitForTat, axl.CyclerCCD)
+
+
+# --------------------------------------------------------------------------- #
+def memory_depth(player: axl.Player) -> float:
+    """Adâncimea declarată; orice valoare nenumerică (de ex. șirul 'inf' dintr-un
+    clasificator generat) contează ca memorie infinită."""
+    depth = player.classifier.get("memory_depth", float("inf"))
+    if isinstance(depth, bool) or not isinstance(depth, numbers.Real) or depth != depth:
+        return float("inf")
+    return depth
+
+
+def is_eligible(player: axl.Player) -> bool:
+    """Determinist, cu memorie finită, întreagă, de cel mult MAX_MEMORY_DEPTH runde."""
+    classifier = player.classifier
+    depth = memory_depth(player)
+    return (
+        not classifier.get("stochastic", True)
+        and not classifier.get("inspects_source", False)
+        and not classifier.get("manipulates_state", False)
+        and not classifier.get("manipulates_source", False)
+        and 0 <= depth <= MAX_MEMORY_DEPTH
+        and depth == int(depth)
+    )
+
+
+def _offsets(depth: int) -> List[int]:
+    """Starea unui istoric de lungime k are indicele offsets[k] + cod (bază 4)."""
+    offsets = [0]
+    for k in range(depth + 1):
+        offsets.append(offsets[-1] + 4 ** k)
+    return offsets
+
+
+def next_state_table(depth: int) -> np.ndarray:
+    """NEXT[stare, rundă] – starea după ce se adaugă runda (0=CC … 3=DD)."""
+    offsets = _offsets(depth)
+    table = np.empty((offsets[-1], 4), dtype=np.int64)
+    for k in range(depth + 1):
+        for code in range(4 ** k):
+            for joint in range(4):
+                if k < depth:
+                    table[offsets[k] + code, joint] = offsets[k + 1] + code * 4 + joint
+                else:
+                    table[offsets[k] + code, joint] = offsets[k] + (code * 4 + joint) % 4 ** depth
+    return table
+
+
+def _decode(code: int, length: int) -> List[int]:
+    """Codul unei stări → rundele ei, de la cea mai veche la cea mai recentă."""
+    rounds = []
+    for _ in range(length):
+        rounds.append(code % 4)
+        code //= 4
+    return rounds[::-1]
+
+
+# --------------------------------------------------------------------------- #
+def transition_table(
+    player: axl.Player, depth: int, turns: int, game: axl.Game
+) -> np.ndarray | None:
+    """Tabelul stare → mutare (0=C, 1=D) al jucătorului, pentru istorice de
+    lungime 0…depth, sau None dacă jucătorul nu se comportă ca o strategie
+    cu memoria declarată."""
+    offsets = _offsets(depth)
+    table = np.empty(offsets[-1], dtype=np.uint8)
+    actions = (C, D)
+    for k in range(depth + 1):
+        for code in range(4 ** k):
+            me, opponent = player.clone(), axl.Cooperator()
+            me.set_match_attributes(length=turns, game=game, noise=0)
+            for joint in _decode(code, k):
+                own, other = actions[joint >> 1], actions[joint & 1]
+                me.update_history(own, other)
+                opponent.update_history(other, own)
+            action = me.strategy(opponent)
+            if action not in actions:
+                return None
+            table[offsets[k] + code] = action == D
+
+    # memoria declarată: după `d` runde contează doar ultimele `d`
+    d = int(memory_depth(player))
+    for k in range(d, depth + 1):
+        for code in range(4 ** k):
+            if table[offsets[k] + code] != table[offsets[d] + code % 4 ** d]:
+                return None
+
+    # comparăm tabelul cu meciuri reale de `turns` runde (prinde stări interne
+    # nedeclarate, inclusiv cele care se schimbă abia târziu în meci)
+    next_state = next_state_table(depth)
+    for opponent_cls in _PROBE_OPPONENTS:
+        match = axl.Match((player.clone(), opponent_cls()), turns=turns, game=game)
+        state = 0
+        for own, other in match.play():
+            if table[state] != (own == D):
+                return None
+            state = next_state[state, 2 * (own == D) + (other == D)]
+    return table
+
+
+# --------------------------------------------------------------------------- #
+class FastEngine:
+    """Joacă în paralel (vectorizat) toate perechile de jucători eligibili.
+
+    Fiecare pereche e o pereche de automate finite; la fiecare rundă se
+    citesc mutările din tabele și se avansează stările, pentru toate
+    perechile odată. Rezultatul unei perechi e același șir codificat ca
+    în engine.encode_interactions.
+    """
+
+    def __init__(self, players: Sequence[axl.Player], turns: int, game: axl.Game):
+        self.players = players
+        self.turns = turns
+        self.game = game
+        candidates = [i for i, p in enumerate(players) if is_eligible(p)]
+        self.depth = int(max((memory_depth(players[i]) for i in candidates), default=0))
+        self.tables: Dict[int, np.ndarray] = {}
+        for i in candidates:
+            try:
+                table = transition_table(players[i], self.depth, turns, game)
+            except Exception:
+                # o strategie care nu suportă istorice arbitrare rămâne pe calea normală
+                table = None
+            if table is not None:
+                self.tables[i] = table
+
+    def supports(self, i: int) -> bool:
+        return i in self.tables
+
+    def play(self, pairs: Sequence[Tuple[int, int]]) -> List[str]:
+        """Joacă perechile (i, j) și întoarce interacțiunile codificate."""
+        if not pairs:
+            return []
+        index = {i: row for row, i in enumerate(self.tables)}
+        tables = np.stack(list(self.tables.values()))
+        next_state = next_state_table(self.depth)
+
+        rows_a = np.array([index[i] for i, _ in pairs])
+        rows_b = np.array([index[j] for _, j in pairs])
+        state_a = np.zeros(len(pairs), dtype=np.int64)
+        state_b = np.zeros(len(pairs), dtype=np.int64)
+        joint = np.empty((len(pairs), self.turns), dtype=np.uint8)
+
+        for turn in range(self.turns):
+            move_a = tables[rows_a, state_a]
+            move_b = tables[rows_b, state_b]
+            joint[:, turn] = 2 * move_a + move_b
+            state_a = next_state[state_a, joint[:, turn]]
+            state_b = next_state[state_b, 2 * move_b + move_a]
+
+        joint += ord("0")
+        return [row.tobytes().decode("ascii") for row in joint]